@@ -12,8 +12,19 @@ Entrypoints:
     - pr-title-generate: Generates a GitHub pull request title.
     - pr-summary-generate: Generates a GitHub pull request summary.
     - pr-context-generate: Generates GitHub pull request context.
+    - pr-all-generate: Generates the title, summary and context concurrently.
+    - pr-bundle-generate: Generates the title, summary and context as JSON
+      from a single LLM request.
     - pr-body-generate: Generates a GitHub pull request body.
 
+The title, summary and context entrypoints share a single LLM request that
+returns all three components as JSON.
+
+Generated components are cached on disk under ~/.cache/klingon_tools/pr_gen,
+keyed by a hash of the repository, commit range, model, prompt template and
+commit log, so regenerating a PR for unchanged commits does not call the LLM
+again. Set KLINGON_TOOLS_NO_CACHE=1 to bypass the cache.
+
 Example:
     To generate a pull request title:
         gh_pr_gen_title()
@@ -24,21 +35,51 @@ Example:
     To generate a pull request context:
         gh_pr_gen_context()
 
+    To generate the title, summary and context in one go:
+        gh_pr_gen_all()
+
+    To generate the title, summary and context with one LLM request:
+        gh_pr_gen_bundle()
+
     To generate a pull request body:
         gh_pr_gen_body()
 
 """
 
 import argparse
-from math import log
+import asyncio
+import dbm
+import functools
+import hashlib
+import json
+import os
+import shelve
+import subprocess
 import traceback
 import warnings
 
-from click import style
-from klingon_tools.git_log_helper import get_commit_log
-from klingon_tools.litellm_tools import LiteLLMTools
+from klingon_tools.llm_templates import DEFAULT_MODEL_PRIMARY, TEMPLATES
 from klingon_tools.log_msg import log_message, klog_hr
 
+# Maps each pull request component to the LiteLLMTools template generating it
+PR_COMPONENT_TEMPLATES = {
+    "title": "pull_request_title",
+    "summary": "pull_request_summary",
+    "context": "pull_request_context",
+}
+
+# The LiteLLMTools template generating every component in one request
+PR_BUNDLE_TEMPLATE = "pull_request_bundle"
+
+# The branch pull request components are generated against
+PR_BASE_REF = "origin/release"
+
+# Where generated PR components are cached between runs
+PR_CACHE_DIR = os.path.join(
+    os.path.expanduser("~"), ".cache", "klingon_tools", "pr_gen"
+)
+
+
 def log_message_entrypoint():
     """
     Entrypoint for logging messages using the log_message function.
@@ -119,14 +160,252 @@ def push_entrypoint():
     return main()
 
 
-# Filter out specific warnings
-warnings.filterwarnings(
-    "ignore", category=DeprecationWarning, module="pydantic"
-)
-warnings.filterwarnings("ignore", category=DeprecationWarning, module="imghdr")
-warnings.filterwarnings(
-    "ignore", category=DeprecationWarning, module="importlib_resources"
-)
+def _install_warning_filters():
+    """
+    Filter out deprecation warnings raised by LiteLLM's dependencies.
+
+    Called before LiteLLMTools is imported so the filters are only installed
+    by the entrypoints that actually load LiteLLM.
+    """
+    warnings.filterwarnings(
+        "ignore", category=DeprecationWarning, module="pydantic"
+    )
+    warnings.filterwarnings(
+        "ignore", category=DeprecationWarning, module="imghdr"
+    )
+    warnings.filterwarnings(
+        "ignore", category=DeprecationWarning, module="importlib_resources"
+    )
+
+
+@functools.lru_cache(maxsize=8)
+def _cached_commit_log(ref):
+    """
+    Get the commit log for a ref, memoized for the lifetime of the process.
+
+    Generating several PR components in one process would otherwise shell
+    out to git for the same log every time. Call
+    `_cached_commit_log.cache_clear()` if a long-running process needs a
+    fresh log.
+
+    Args:
+        ref (str): The branch or ref to compare against HEAD.
+
+    Returns:
+        subprocess.CompletedProcess: The cached commit log result.
+    """
+    from klingon_tools.git_log_helper import get_commit_log
+
+    return get_commit_log(ref)
+
+
+def _pr_commit_log():
+    """
+    Get the commit log the pull request components are generated from.
+
+    Returns:
+        str: The commit log against the 'origin/release' branch.
+    """
+    return _cached_commit_log(PR_BASE_REF).stdout
+
+
+@functools.lru_cache(maxsize=1)
+def _pr_commit_range():
+    """
+    Identify the repository and commit range pull requests are generated for.
+
+    Returns:
+        str: The repository top-level path followed by the commit SHAs of
+        'origin/release' and HEAD, or None if they cannot be resolved.
+    """
+    result = subprocess.run(
+        ["git", "rev-parse", "--show-toplevel", PR_BASE_REF, "HEAD"],
+        capture_output=True,
+        text=True,
+        check=False,
+    )
+    if result.returncode != 0:
+        return None
+    return result.stdout.strip()
+
+
+def _load_litellm_tools():
+    """
+    Import and initialise LiteLLMTools.
+
+    Returns:
+        LiteLLMTools: A new LiteLLMTools instance.
+    """
+    _install_warning_filters()
+    from klingon_tools.litellm_tools import LiteLLMTools
+
+    return LiteLLMTools()
+
+
+def _pr_cache_key(template_key, diff):
+    """
+    Build the cache key for generated pull request content.
+
+    The key covers the repository and commit range, the model, the template
+    name and text, and the commit log, so changing any of them is a miss.
+    The model and template come from llm_templates rather than a
+    LiteLLMTools instance, so a cache hit never has to import LiteLLM.
+
+    Args:
+        template_key (str): The LiteLLMTools template generating it.
+        diff (str): The commit log the content is generated from.
+
+    Returns:
+        str: The SHA-256 hex digest identifying the generated content.
+    """
+    key_parts = (
+        _pr_commit_range(),
+        DEFAULT_MODEL_PRIMARY,
+        template_key,
+        TEMPLATES[template_key],
+        diff,
+    )
+    return hashlib.sha256("\0".join(key_parts).encode()).hexdigest()
+
+
+def _pr_cache_enabled(diff):
+    """
+    Check whether the pull request cache should be used.
+
+    Args:
+        diff (str): The commit log the content is generated from.
+
+    Returns:
+        bool: False if KLINGON_TOOLS_NO_CACHE is set to 1, the commit log is
+        empty or the commit range cannot be resolved, True otherwise.
+    """
+    return (
+        os.environ.get("KLINGON_TOOLS_NO_CACHE") != "1"
+        and bool(diff.strip())
+        and _pr_commit_range() is not None
+    )
+
+
+def _pr_cache_get(template_key, diff):
+    """
+    Look up cached pull request content.
+
+    Args:
+        template_key (str): The LiteLLMTools template generating it.
+        diff (str): The commit log the content is generated from.
+
+    Returns:
+        The cached content, or None if it is not cached.
+    """
+    if not _pr_cache_enabled(diff):
+        return None
+    try:
+        with shelve.open(os.path.join(PR_CACHE_DIR, "cache"), "r") as cache:
+            return cache.get(_pr_cache_key(template_key, diff))
+    except dbm.error:  # Also covers OSError
+        # A missing or unreadable cache is just a cache miss
+        return None
+
+
+def _pr_cache_set(template_key, diff, content):
+    """
+    Store generated pull request content in the cache.
+
+    Args:
+        template_key (str): The LiteLLMTools template that generated it.
+        diff (str): The commit log the content was generated from.
+        content: The generated content.
+    """
+    if not _pr_cache_enabled(diff):
+        return
+    try:
+        os.makedirs(PR_CACHE_DIR, exist_ok=True)
+        with shelve.open(os.path.join(PR_CACHE_DIR, "cache")) as cache:
+            cache[_pr_cache_key(template_key, diff)] = content
+    except dbm.error as e:  # Also covers OSError
+        log_message.debug(f"Unable to write PR cache: {e}")
+
+
+def _generate_pr_bundle():
+    """
+    Generate the pull request title, summary and context in one request.
+
+    The bundle is cached as a whole under its own template, so the single
+    component entrypoints share one request and never mix in components
+    generated by gh_pr_gen_all's separate prompts. LiteLLM is only loaded
+    on a cache miss.
+
+    Returns:
+        dict: The generated content keyed by component name.
+    """
+    diff = _pr_commit_log()
+    bundle = _pr_cache_get(PR_BUNDLE_TEMPLATE, diff)
+    if bundle is not None:
+        log_message.debug("Using cached PR bundle")
+        return bundle
+
+    bundle = _load_litellm_tools().generate_pr_bundle(diff)
+    _pr_cache_set(PR_BUNDLE_TEMPLATE, diff, bundle)
+    return bundle
+
+
+async def _gen_all(diff, litellm_tools=None):
+    """
+    Generate the pull request title, summary and context concurrently.
+
+    Cached components are reused, and one request per remaining component is
+    dispatched through LiteLLMTools.agenerate_content and awaited with
+    asyncio.gather, so the total latency is that of the slowest request
+    rather than their sum. The requests share a RateLimiter configured from
+    KLINGON_TOOLS_MAX_RPM and KLINGON_TOOLS_MAX_TPM so they stay under the
+    provider's rate limits.
+
+    Args:
+        diff (str): The commit log to generate the components from.
+        litellm_tools (LiteLLMTools, optional): The tools instance to use.
+            A new instance is created when not provided and a component is
+            missing from the cache.
+
+    Returns:
+        dict: The generated content keyed by component name. A component
+        that failed to generate holds the raised exception instead.
+    """
+    components = {
+        component: _pr_cache_get(template_key, diff)
+        for component, template_key in PR_COMPONENT_TEMPLATES.items()
+    }
+    missing = [
+        component for component, content in components.items()
+        if content is None
+    ]
+    if not missing:
+        return components
+
+    if litellm_tools is None:
+        litellm_tools = _load_litellm_tools()
+
+    from klingon_tools.litellm_tools import RateLimiter
+
+    rate_limiter = RateLimiter.from_env()
+    results = await asyncio.gather(
+        *(
+            litellm_tools.agenerate_content(
+                PR_COMPONENT_TEMPLATES[component], diff, rate_limiter)
+            for component in missing
+        ),
+        return_exceptions=True,
+    )
+
+    for component, result in zip(missing, results):
+        if isinstance(result, BaseException):
+            components[component] = result
+            continue
+        content, _ = result
+        if component == "title":
+            content = litellm_tools.format_pr_title(content)
+        components[component] = content
+        _pr_cache_set(PR_COMPONENT_TEMPLATES[component], diff, content)
+    return components
 
 
 def gh_pr_gen_title():
@@ -134,8 +413,8 @@ def gh_pr_gen_title():
     Generate and print a GitHub pull request title using OpenAI tools.
 
     This function fetches the commit log from the 'origin/release' branch,
-    generates a pull request title using OpenAI's API, prints the title,
-    and returns it.
+    generates the pull request components with a single LLM request, and
+    prints the title.
 
     Entrypoint:
         pr-title-generate
@@ -145,10 +424,7 @@ def gh_pr_gen_title():
     """
     try:
         log_message.info("Generating PR title using LiteLLMTools...")
-        commit_result = get_commit_log("origin/release")
-        diff = commit_result.stdout
-        litellm_tools = LiteLLMTools()
-        pr_title = litellm_tools.generate_pull_request_title(diff)
+        pr_title = _generate_pr_bundle()["title"]
         print(pr_title)
         return 0
     except ImportError as e:
@@ -174,8 +450,8 @@ def gh_pr_gen_summary():
     Generate and print a GitHub pull request summary using OpenAI tools.
 
     This function fetches the commit log from the 'origin/release' branch,
-    generates a pull request summary using OpenAI's API, and prints the
-    summary.
+    generates the pull request components with a single LLM request, and
+    prints the summary.
 
     Entrypoint:
         pr-summary-generate
@@ -185,8 +461,7 @@ def gh_pr_gen_summary():
     """
     try:
         log_message.info("Generating PR summary using LiteLLMTools...")
-        litellm_tools = LiteLLMTools()
-        pr_summary = litellm_tools.generate_pull_request_summary()
+        pr_summary = _generate_pr_bundle()["summary"]
         print(pr_summary)
         return 0
     except ImportError as e:
@@ -209,8 +484,8 @@ def gh_pr_gen_context():
     Generate and print GitHub pull request context using LiteLLM.
 
     This function fetches the commit log from the 'origin/release' branch,
-    generates the pull request context using LiteLLM's API, and prints the
-    context.
+    generates the pull request components with a single LLM request, and
+    prints the context.
 
     Entrypoint:
         pr-context-generate
@@ -220,8 +495,7 @@ def gh_pr_gen_context():
     """
     try:
         log_message.info("Generating PR context using LiteLLMTools...")
-        litellm_tools = LiteLLMTools()
-        pr_context = litellm_tools.generate_pull_request_context()
+        pr_context = _generate_pr_bundle()["context"]
         print(pr_context)
         return 0
     except ImportError as e:
@@ -237,3 +511,78 @@ def gh_pr_gen_context():
         log_message.error(f"Unexpected error occurred: {e}")
         log_message.error(f"Traceback: {traceback.format_exc()}")
         return 1
+
+
+def gh_pr_gen_all():
+    """
+    Generate and print the GitHub pull request title, summary and context.
+
+    This function fetches the commit log from the 'origin/release' branch
+    once and generates all three components concurrently using LiteLLM's
+    async API.
+
+    Entrypoint:
+        pr-all-generate
+
+    Returns:
+        int: 0 for success, 1 for failure
+    """
+    try:
+        log_message.info("Generating PR title, summary and context...")
+        components = asyncio.run(_gen_all(_pr_commit_log()))
+
+        failed = False
+        for component, content in components.items():
+            if isinstance(content, BaseException):
+                log_message.error(
+                    f"Failed to generate PR {component}: {content}")
+                failed = True
+                continue
+            print(content)
+        return 1 if failed else 0
+    except ImportError as e:
+        log_message.error(f"Failed to import required module: {e}")
+        return 1
+    except ValueError as e:
+        log_message.error(f"Invalid value encountered: {e}")
+        return 1
+    except ConnectionError as e:
+        log_message.error(f"Network connection error: {e}")
+        return 1
+    except Exception as e:  # pylint: disable=broad-except
+        log_message.error(f"Unexpected error occurred: {e}")
+        log_message.error(f"Traceback: {traceback.format_exc()}")
+        return 1
+
+
+def gh_pr_gen_bundle():
+    """
+    Generate and print the GitHub pull request title, summary and context.
+
+    This function fetches the commit log from the 'origin/release' branch,
+    generates all three components with a single LiteLLM request, and prints
+    them as a JSON object.
+
+    Entrypoint:
+        pr-bundle-generate
+
+    Returns:
+        int: 0 for success, 1 for failure
+    """
+    try:
+        log_message.info("Generating PR bundle using LiteLLMTools...")
+        print(json.dumps(_generate_pr_bundle(), indent=2))
+        return 0
+    except ImportError as e:
+        log_message.error(f"Failed to import required module: {e}")
+        return 1
+    except ValueError as e:
+        log_message.error(f"Invalid value encountered: {e}")
+        return 1
+    except ConnectionError as e:
+        log_message.error(f"Network connection error: {e}")
+        return 1
+    except Exception as e:  # pylint: disable=broad-except
+        log_message.error(f"Unexpected error occurred: {e}")
+        log_message.error(f"Traceback: {traceback.format_exc()}")
+        return 1
@@ -0,0 +1,31 @@
+# klingon_tools/git_commit_index.py
+"""Module for committing the staged index with git plumbing commands."""
+
+from git import GitCommandError, Repo
+from klingon_tools.log_msg import log_message
+
+
+def git_commit_index(repo: Repo, commit_message: str) -> None:
+    """Commits the staged index with git plumbing commands.
+
+    write-tree, commit-tree and update-ref create the commit directly,
+    avoiding the index serialisation and hooks run by repo.index.commit.
+    Falls back to repo.index.commit if they fail, e.g. when HEAD has no
+    commit yet.
+
+    Args:
+        repo: An instance of the git.Repo object representing the repository.
+        commit_message: The message of the commit to create.
+    """
+    try:
+        parent_sha = repo.head.commit.hexsha
+        tree_sha = repo.git.write_tree()
+        commit_sha = repo.git.commit_tree(
+            tree_sha, "-p", parent_sha, "-m", commit_message)
+        # Only move HEAD if it still points at the parent
+        repo.git.update_ref(
+            "-m", f"commit: {commit_message.splitlines()[0]}",
+            "HEAD", commit_sha, parent_sha)
+    except (GitCommandError, ValueError) as e:
+        log_message.debug(f"Falling back to index commit: {e}")
+        repo.index.commit(commit_message)
@@ -25,18 +25,35 @@ from click import style
 from klingon_tools.git_commit_fix import fix_commit_message
 from klingon_tools.log_msg import klog_hr
 
+# Use the linear time RE2 engine when google-re2 is installed
+try:
+    import re2 as _re
+except ImportError:
+    _re = re
+
+# Patterns compiled once at import time as they run for every commit message
+_PREFIX_RE = _re.compile(r'^(\s*[^\w\s]+\s*)')
+_TYPE_RE = _re.compile(r"^(\w+)\(")
+_SCOPE_RE = _re.compile(r"^\w+\(([^)]+)\):")
+_DESCRIPTION_RE = _re.compile(r"^\w+\([^)]+\):\s+(.+)")
+# Inline (?m) flag as the re2 module has no MULTILINE constant
+_SIGNOFF_RE = _re.compile(r"(?m)^Signed-off-by: .+ <.+@.+>$")
+
 
 def is_commit_message_signed_off(commit_message: str) -> bool:
     """
     Check if the commit message is signed off.
 
+    A sign-off is a line of the form "Signed-off-by: Name <email>", found
+    with a single multiline search rather than by checking each line.
+
     Args:
         commit_message: The commit message to check.
 
     Returns:
         True if the commit message is signed off, False otherwise.
     """
-    return "Signed-off-by:" in commit_message.strip()
+    return _SIGNOFF_RE.search(commit_message) is not None
 
 
 def check_prefix(
@@ -57,7 +74,7 @@ def check_prefix(
     """
     import emoji
     # Check for emoji at the start of the message
-    match = re.match(r'^(\s*[^\w\s]+\s*)', commit_message)
+    match = _PREFIX_RE.match(commit_message)
     if match:
         prefix = match.group(1)
         if any(emoji.is_emoji(char) for char in prefix):
@@ -93,7 +110,7 @@ def check_type(commit_message: str, log_message: Any) -> bool:
     ]
 
     # Check if the commit type is valid
-    match = re.match(r"^(\w+)\(", commit_message)
+    match = _TYPE_RE.match(commit_message)
     if not match:
         log_message.error(
             message="Invalid commit type. Type must be one of: "
@@ -126,7 +143,7 @@ def check_scope(commit_message: str, log_message: Any) -> bool:
     Returns:
         True if the scope is present and valid, False otherwise.
     """
-    match = re.match(r"^\w+\(([^)]+)\):", commit_message)
+    match = _SCOPE_RE.match(commit_message)
     if not match:
         log_message.error("Commit message must include a valid scope in "
                           "the format (scope).", status="❌")
@@ -153,7 +170,7 @@ def check_description(commit_message: str, log_message: Any) -> bool:
     Returns:
         True if the description is present and valid, False otherwise.
     """
-    match = re.match(r"^\w+\([^)]+\):\s+(.+)", commit_message)
+    match = _DESCRIPTION_RE.match(commit_message)
     if not match:
         log_message.error("Commit message must include a description "
                           "after the scope.", status="❌")
@@ -184,7 +201,7 @@ def check_line_length(
         A tuple where the first element is True if the first line length is valid,
         False otherwise, and the second element is the fixed message if auto-fixed.
     """
-    first_line = commit_message.split('\n')[0]
+    first_line = commit_message.partition('\n')[0]
     first_line_length = len(first_line)
     if first_line_length > 72:
         log_message.error(
@@ -530,6 +547,9 @@ def validate_commit_message(
                 if fixed:
                     # Replace the first line with the fixed message
                     fixed_message = fixed + "\n" + "\n".join(commit_lines[1:])
+                    if prefix:
+                        # Keep the emoji prefix removed by check_prefix
+                        fixed_message = f"{prefix} {fixed_message}"
                     log_message.info(
                         message=f"First line auto-fixed: {fixed}",
                         status="✅"
@@ -0,0 +1,41 @@
+# klingon_tools/git_dirty.py
+"""Module for checking whether a Git working tree has uncommitted changes."""
+
+import subprocess
+from git import Repo
+
+
+def git_is_dirty(repo: Repo, include_untracked: bool = False) -> bool:
+    """Checks whether the working tree has uncommitted changes.
+
+    This is a cheaper alternative to repo.is_dirty(untracked_files=True),
+    which always runs a full `git status` including the untracked file scan.
+    Tracked changes are detected with `git diff --quiet HEAD`, which stops at
+    the first difference, and untracked files are only listed when
+    explicitly requested.
+
+    Args:
+        repo: An instance of the git.Repo object representing the repository.
+        include_untracked: Whether untracked files count as changes.
+
+    Returns:
+        True if the working tree has changes, False otherwise.
+    """
+    result = subprocess.run(
+        ["git", "diff", "--quiet", "HEAD"],
+        cwd=repo.working_dir,
+        capture_output=True,
+        check=False,
+    )
+    if result.returncode != 0:
+        return True
+    if not include_untracked:
+        return False
+    untracked = subprocess.run(
+        ["git", "ls-files", "--others", "--exclude-standard"],
+        cwd=repo.working_dir,
+        capture_output=True,
+        text=True,
+        check=False,
+    )
+    return bool(untracked.stdout.strip())
@@ -16,9 +16,21 @@ Typical usage example:
 import subprocess
 import git
 from git import GitCommandError
+from klingon_tools.git_commit_index import git_commit_index
 from klingon_tools.log_msg import log_message
 from klingon_tools.litellm_tools import LiteLLMTools
 
+# Shared LiteLLMTools instance, created on first use by _get_litellm_tools
+_litellm_tools = None
+
+
+def _get_litellm_tools() -> LiteLLMTools:
+    """Returns the shared LiteLLMTools instance, creating it if needed."""
+    global _litellm_tools
+    if _litellm_tools is None:
+        _litellm_tools = LiteLLMTools()
+    return _litellm_tools
+
 
 def git_push(repo: git.Repo) -> None:
     """Pushes changes to the remote repository.
@@ -39,8 +51,7 @@ def git_push(repo: git.Repo) -> None:
         repo.git.reset()
         _handle_file_deletions(repo)
 
-        litellm_tools = LiteLLMTools()
-        _generate_and_commit_messages(repo, litellm_tools)
+        _generate_and_commit_messages(repo, _get_litellm_tools())
 
         if _is_submodule(repo):
             _handle_submodule(repo)
@@ -57,20 +68,22 @@ def git_push(repo: git.Repo) -> None:
 
 def _handle_file_deletions(repo: git.Repo) -> None:
     """Handles file deletions in the repository."""
-    deleted_files = subprocess.run(
-        ["git", "ls-files", "--deleted"],
-        capture_output=True,
-        text=True,
-        check=True,
-    ).stdout.splitlines()
-
-    for file in deleted_files:
-        try:
-            repo.index.remove([file], working_tree=True)
-            commit_message = f"chore({file}): Cleanup deleted items"
-            repo.index.commit(commit_message)
-        except GitCommandError as e:
-            log_message.error(f"Failed to handle deletion for {file}: {e}")
+    deleted_files = repo.git.ls_files("--deleted").splitlines()
+
+    if not deleted_files:
+        return
+
+    # Stage every deletion at once and record them in a single commit
+    try:
+        repo.index.remove(deleted_files, working_tree=True)
+        commit_message = (
+            f"chore(cleanup): Cleanup {len(deleted_files)} deleted item(s)"
+        )
+        git_commit_index(repo, commit_message)
+    except GitCommandError as e:
+        log_message.error(
+            f"Failed to handle deletions for {', '.join(deleted_files)}: {e}"
+        )
 
 
 def _generate_and_commit_messages(repo: git.Repo,
@@ -116,9 +129,10 @@ def push_changes(repo: git.Repo) -> None:
     Pushes changes to the remote repository after all commits are made.
 
     This function ensures that the local repository is in sync with the remote
-    repository before pushing changes. It stashes any unstaged changes, rebases
-    the current branch on top of the remote branch, and then pushes the
-    changes.
+    repository before pushing changes. It pulls the remote branch with
+    --rebase --autostash, which stashes any local changes, rebases the current
+    branch on top of the remote branch and restores the changes, and then
+    pushes the changes.
 
     Args:
         repo: The Git repository object.
@@ -127,25 +141,11 @@ def push_changes(repo: git.Repo) -> None:
         GitCommandError: If any git command fails.
     """
     try:
-        repo.remotes.origin.fetch()
         current_branch = repo.active_branch.name
 
-        stash_needed = repo.is_dirty(untracked_files=True)
-        if stash_needed:
-            repo.git.stash(
-                "save",
-                "--include-untracked",
-                "Auto stash before rebase"
-            )
-
-        repo.git.rebase(f"origin/{current_branch}")
-
-        if stash_needed:
-            try:
-                repo.git.stash("pop")
-            except GitCommandError as e:
-                log_message.error("Failed to apply stashed changes",
-                                  status="❌", reason=str(e))
+        # Let git fetch, stash local changes, rebase and restore them in a
+        # single invocation
+        repo.git.pull("--rebase", "--autostash", "origin", current_branch)
 
         repo.remotes.origin.push()
         log_message.info("Pushed changes to remote repository", status="✅")
@@ -1,4 +1,5 @@
 from git import Repo
+from klingon_tools.git_dirty import git_is_dirty
 from klingon_tools.log_msg import log_message
 import sys
 
@@ -59,7 +60,7 @@ def git_stage_diff(file_name: str, repo: Repo, modified_files: list) -> str:
     # Recursively stage files in submodules
     for submodule in repo.submodules:
         submodule_repo = submodule.module()
-        if submodule_repo.is_dirty(untracked_files=True):
+        if git_is_dirty(submodule_repo, include_untracked=True):
             stage_file(submodule_repo, file_name)
 
     # Generate the diff for the staged file
@@ -27,6 +27,8 @@ from git import (
     exc as git_exc,
 )
 
+from klingon_tools.git_commit_index import git_commit_index
+from klingon_tools.git_dirty import git_is_dirty
 from klingon_tools.git_push_helper import git_push
 from klingon_tools.git_user_info import get_git_user_info
 from klingon_tools.log_msg import log_message
@@ -389,7 +391,7 @@ def push_changes_if_needed(repo: Repo, args) -> None:
         """Recursively push changes in submodules."""
         for submodule in repo.submodules:
             submodule_repo = submodule.module()
-            if submodule_repo.is_dirty(untracked_files=True):
+            if git_is_dirty(submodule_repo, include_untracked=True):
                 submodule_repo.git.add(A=True)
                 submodule_repo.index.commit("Update submodule")
                 push_submodules(submodule_repo)
@@ -460,17 +462,19 @@ def fix_commit_message(commit_message: str) -> str:
 
 def handle_file_deletions(repo: Repo) -> None:
     """Handles file deletions in the repository."""
-    deleted_files = subprocess.run(
-        ["git", "ls-files", "--deleted"],
-        capture_output=True,
-        text=True,
-        check=True,
-    ).stdout.splitlines()
-
-    for file in deleted_files:
-        try:
-            repo.index.remove([file], working_tree=True)
-            commit_message = f"chore({file}): Cleanup deleted items"
-            repo.index.commit(commit_message)
-        except GitCommandError as e:
-            log_message.error(f"Failed to handle deletion for {file}: {e}")
+    deleted_files = repo.git.ls_files("--deleted").splitlines()
+
+    if not deleted_files:
+        return
+
+    # Stage every deletion at once and record them in a single commit
+    try:
+        repo.index.remove(deleted_files, working_tree=True)
+        commit_message = (
+            f"chore(cleanup): Cleanup {len(deleted_files)} deleted item(s)"
+        )
+        git_commit_index(repo, commit_message)
+    except GitCommandError as e:
+        log_message.error(
+            f"Failed to handle deletions for {', '.join(deleted_files)}: {e}"
+        )
@@ -1,6 +1,8 @@
 """Provides functionality for running and logging pytest results."""
 
 import argparse
+import contextlib
+import importlib.util
 import io
 import sys
 from unittest.mock import MagicMock
@@ -18,7 +20,8 @@ class KTestLogPlugin:
         """Initialize the KTestLogPlugin.
 
         Args:
-            results: A list to store test results.
+            results: A list to store test results in, as dicts with "name"
+                and "outcome" keys.
         """
         self.log_message = log_message
         self.results = results
@@ -44,14 +47,18 @@ class KTestLogPlugin:
                         message=f"{test_name} (skipped due to --no-llm)",
                         status="SKIPPED 🦘"
                     )
-                    self.results.append((test_name, "skipped"))
+                    self._add_result(test_name, "skipped")
                 else:
                     self._log_skipped_test(test_name)
 
+    def _add_result(self, test_name, outcome):
+        """Record the outcome of a test."""
+        self.results.append({"name": test_name, "outcome": outcome})
+
     def _log_passed_test(self, test_name):
         """Log a passed test."""
         self.log_message.info(message=f"{test_name}", status="✅")
-        self.results.append((test_name, "passed"))
+        self._add_result(test_name, "passed")
 
     def _log_failed_test(self, test_name, report):
         """Log a failed test."""
@@ -59,10 +66,10 @@ class KTestLogPlugin:
             self.log_message.warning(
                 message=f"{test_name} (optional)", status="👾"
             )
-            self.results.append((test_name, "optional-failed"))
+            self._add_result(test_name, "optional-failed")
         else:
             self.log_message.error(message=f"{test_name}", status="❌")
-            self.results.append((test_name, "failed"))
+            self._add_result(test_name, "failed")
 
         self._log_exception_info(test_name, report)
 
@@ -72,7 +79,7 @@ class KTestLogPlugin:
             message=f"{test_name}",
             status="SKIPPED 🦘"
         )
-        self.results.append((test_name, "skipped"))
+        self._add_result(test_name, "skipped")
 
     def _log_exception_info(self, test_name, report):
         """Log exception information for a failed test."""
@@ -81,7 +88,7 @@ class KTestLogPlugin:
             status="",
             style="none"
         )
-        print(report.longrepr)
+        print(report.longrepr, file=sys.__stdout__)
 
         if isinstance(
                 self.log_message.logger,
@@ -96,11 +103,11 @@ class KTestLogPlugin:
             status="",
             style="none"
         )
-        print(report.caplog)
+        print(report.caplog, file=sys.__stdout__)
         if hasattr(report, 'captured_stdout'):
-            print(report.captured_stdout)
+            print(report.captured_stdout, file=sys.__stdout__)
         if hasattr(report, 'captured_stderr'):
-            print(report.captured_stderr)
+            print(report.captured_stderr, file=sys.__stdout__)
 
 
 def ktest(
@@ -116,29 +123,38 @@ def ktest(
     results = []
     plugin = KTestLogPlugin(results)
 
-    _setup_output_capture(suppress_output, loglevel)
-
     pytest_args = _prepare_pytest_args(no_llm)
-    exit_code = pytest.main(pytest_args, plugins=[plugin])
+    with _capture_output(suppress_output, loglevel):
+        exit_code = pytest.main(pytest_args, plugins=[plugin])
 
-    _restore_output(suppress_output)
+    return exit_code if as_entrypoint else results
 
-    results_obj = [
-        {"name": test_name, "outcome": outcome}
-        for test_name, outcome in results
-    ]
 
-    return exit_code if as_entrypoint else results_obj
+@contextlib.contextmanager
+def _capture_output(suppress_output, loglevel):
+    """Suppress stdout and stderr while the block runs.
+
+    Output is only captured when suppress_output is set and the log level is
+    not DEBUG. The previous streams are restored on exit, even if the block
+    raises.
 
+    Yields:
+        The StringIO receiving the captured output, or None if output is not
+        being suppressed.
+    """
+    if not suppress_output or loglevel.upper() == "DEBUG":
+        yield None
+        return
 
-def _setup_output_capture(suppress_output, loglevel):
-    """Set up output capture if suppression is enabled."""
-    if suppress_output and loglevel.upper() != "DEBUG":
-        captured_output = io.StringIO()
-        sys.stdout = captured_output
-        sys.stderr = captured_output
-        return captured_output
-    return None
+    captured_output = io.StringIO()
+    with contextlib.redirect_stdout(captured_output), \
+            contextlib.redirect_stderr(captured_output):
+        yield captured_output
+
+
+def _xdist_available():
+    """Check whether pytest-xdist is installed."""
+    return importlib.util.find_spec("xdist") is not None
 
 
 def _prepare_pytest_args(no_llm):
@@ -150,19 +166,17 @@ def _prepare_pytest_args(no_llm):
         "-v",
         "-q",
         "--disable-warnings",
+        "-p",
+        "no:cacheprovider",
     ]
+    # Spread the tests across all cores when pytest-xdist is available
+    if _xdist_available():
+        pytest_args.extend(["-n", "auto"])
     if no_llm:
         pytest_args.append("--no-llm")
     return pytest_args
 
 
-def _restore_output(suppress_output, captured_output=None):
-    """Restore stdout and stderr if output was suppressed."""
-    if suppress_output:
-        sys.stdout = sys.__stdout__
-        sys.stderr = sys.__stderr__
-
-
 def ktest_entrypoint(args=None):
     """Entrypoint for running ktest as a script."""
     parser = argparse.ArgumentParser(description="Run ktest")
@@ -16,16 +16,30 @@ Example:
     pr_summary = tools.generate_pull_request_summary(diff)
     pr_context = tools.generate_pull_request_context(diff)
 
+    # Generate the title, summary and context with a single request
+    pr_bundle = tools.generate_pr_bundle(diff)
+
+    # Generate several prompts concurrently without exceeding rate limits
+    async def generate_all(diff):
+        limiter = RateLimiter.from_env()
+        return await asyncio.gather(
+            tools.agenerate_content("pull_request_title", diff, limiter),
+            tools.agenerate_content("pull_request_summary", diff, limiter),
+        )
+
 Note:
     A complete list of available litellm models and their costs are available
     at: https://models.litellm.ai/
 """
 
+import asyncio
+import json
 import os
 import subprocess
 import textwrap
 import logging
 import time
+from collections import deque
 from typing import Tuple, Optional
 
 import litellm
@@ -47,6 +61,170 @@ from klingon_tools.git_user_info import get_git_user_info
 from klingon_tools.log_msg import log_message
 from klingon_tools.git_log_helper import get_commit_log
 from klingon_tools.git_stage import git_stage_diff
+from klingon_tools.llm_templates import (
+    DEFAULT_MODEL_PRIMARY,
+    DEFAULT_MODEL_SECONDARY,
+    TEMPLATES,
+)
+
+# Keys of the JSON object returned by LiteLLMTools.generate_pr_bundle
+PR_BUNDLE_KEYS = ("title", "summary", "context")
+
+# Attempts made by generate_content and agenerate_content before giving up
+GENERATION_RETRIES = 3
+
+# Errors that are never retried
+_CRITICAL_ERRORS = (
+    AuthenticationError,
+    PermissionDeniedError,
+    ContentPolicyViolationError,
+)
+
+# Errors that are retried until GENERATION_RETRIES is reached
+_RETRYABLE_ERRORS = (
+    RateLimitError,
+    BadRequestError,
+    NotFoundError,
+    UnprocessableEntityError,
+    InternalServerError,
+    ContextWindowExceededError,
+    APIConnectionError,
+)
+
+
+class RateLimiter:
+    """Proactively throttle concurrent LLM requests.
+
+    Requests are held back before they are sent, rather than retried after a
+    429, so that concurrent requests stay under the account's requests per
+    minute (RPM) and tokens per minute (TPM) limits. The number of requests in
+    flight is bounded by a semaphore sized from the RPM limit, and requests
+    sent and tokens used are tracked over a rolling window.
+
+    A RateLimiter must be created and used within a single event loop.
+    """
+
+    def __init__(
+        self,
+        max_requests_per_minute: int = 500,
+        max_tokens_per_minute: int = 200000,
+        window: float = 60.0,
+    ):
+        """Initialize the RateLimiter.
+
+        Args:
+            max_requests_per_minute: Maximum requests sent per window.
+            max_tokens_per_minute: Maximum estimated tokens sent per window.
+            window: Length of the rolling window in seconds.
+        """
+        self.max_requests_per_minute = max_requests_per_minute
+        self.max_tokens_per_minute = max_tokens_per_minute
+        self.window = window
+        self._semaphore = asyncio.Semaphore(
+            max(1, max_requests_per_minute // 60)
+        )
+        self._lock = asyncio.Lock()
+        self._history = deque()  # (timestamp, tokens) of requests sent
+
+    @classmethod
+    def from_env(cls) -> "RateLimiter":
+        """Create a RateLimiter configured from environment variables.
+
+        KLINGON_TOOLS_MAX_RPM and KLINGON_TOOLS_MAX_TPM override the default
+        requests and tokens per minute limits.
+
+        Returns:
+            RateLimiter: The configured rate limiter.
+        """
+        return cls(
+            max_requests_per_minute=int(
+                os.environ.get("KLINGON_TOOLS_MAX_RPM", 500)),
+            max_tokens_per_minute=int(
+                os.environ.get("KLINGON_TOOLS_MAX_TPM", 200000)),
+        )
+
+    async def acquire(self, tokens: int) -> None:
+        """Wait until a request using the given tokens may be sent.
+
+        Every call must be paired with a call to release once the request
+        has completed.
+
+        Args:
+            tokens: The estimated number of tokens the request will use.
+        """
+        await self._semaphore.acquire()
+        try:
+            async with self._lock:
+                await self._wait_for_capacity(tokens)
+        except BaseException:
+            self._semaphore.release()
+            raise
+
+    def release(self) -> None:
+        """Mark a request acquired with acquire as completed."""
+        self._semaphore.release()
+
+    async def _wait_for_capacity(self, tokens: int) -> None:
+        """Sleep until the rolling window has room, then record the request.
+
+        Args:
+            tokens: The estimated number of tokens the request will use.
+        """
+        while True:
+            now = time.monotonic()
+            while self._history and now - self._history[0][0] >= self.window:
+                self._history.popleft()
+
+            tokens_used = sum(used for _, used in self._history)
+            # A single request larger than the TPM limit is let through once
+            # the window is empty rather than blocking forever
+            if not self._history or (
+                len(self._history) < self.max_requests_per_minute
+                and tokens_used + tokens <= self.max_tokens_per_minute
+            ):
+                self._history.append((now, tokens))
+                return
+
+            await asyncio.sleep(self.window - (now - self._history[0][0]))
+
+
+def estimate_tokens(messages: list) -> int:
+    """Roughly estimate the number of prompt tokens in chat messages.
+
+    Uses the common approximation of four characters per token, which is
+    close enough for rate limiting without loading a tokenizer.
+
+    Args:
+        messages: The chat messages to be sent.
+
+    Returns:
+        int: The estimated number of tokens.
+    """
+    return sum(len(message["content"]) for message in messages) // 4 + 1
+
+
+async def throttled_complete(
+    rate_limiter: Optional[RateLimiter] = None,
+    **kwargs
+):
+    """Call litellm.acompletion once the rate limiter allows it.
+
+    Args:
+        rate_limiter: The rate limiter to wait on. The request is sent
+            immediately if None.
+        **kwargs: Arguments passed through to litellm.acompletion.
+
+    Returns:
+        The litellm completion response.
+    """
+    if rate_limiter is None:
+        return await litellm.acompletion(**kwargs)
+
+    await rate_limiter.acquire(estimate_tokens(kwargs["messages"]))
+    try:
+        return await litellm.acompletion(**kwargs)
+    finally:
+        rate_limiter.release()
 
 
 class LiteLLMTools:
@@ -55,8 +233,8 @@ class LiteLLMTools:
     def __init__(
         self,
         debug: bool = False,
-        model_primary: str = "gpt-4o-mini",
-        model_secondary: str = "claude-3-haiku-20240307",
+        model_primary: str = DEFAULT_MODEL_PRIMARY,
+        model_secondary: str = DEFAULT_MODEL_SECONDARY,
         log_http_requests: bool = False,
     ):
         """Initialize the LiteLLMTools class.
@@ -86,141 +264,7 @@ class LiteLLMTools:
             "gpt-4o-mini",  # Default fallback model
         ]
 
-        self.templates = {
-            "commit_message_system": """
-            You are an AI assistant specialized in generating clear, concise,
-            and informative git commit messages, pull request titles, contexts
-            and summaries.
-
-            Your task is to analyze code diffs and produce git repository
-            documentation that accurately reflect the changes made.
-
-            Follow best practices for commit messages, including using the
-            Conventional Commits format when appropriate.
-
-            When provided with message length or column widths, **they are
-            mandatory and must not be exceeded.**
-
-            Return all results as raw plain text containing only the answer
-            unless otherwise specified.
-            """,
-            "commit_message_user": """
-            Generate a git commit message based on these diffs: "{diff}"
-
-            Follow the Conventional Commits standard using the following
-            format:
-            <type>(scope): <description>
-
-            [optional body]
-
-            [optional footer(s)]
-
-            The first line of a conventional commit must not exceed 72
-            characters and must be followed by a blank line. The body and
-            footer are both optional but must be separated by a blank line if
-            present and also must not exceed 72 characters.
-
-            Consider the following options when selecting commit types:
-            - build: updates to build system & external dependencies
-            - chore: changes that don't modify src or test files
-            - ci: changes to CI configuration files and scripts
-            - docs: updates to documentation & comments
-            - feat: add new feature or function to the codebase
-            - fix: correct bugs and other errors in code
-            - perf: improve performance without changing existing functionality
-            - refactor: code changes that neither fix bugs nor add features
-            - revert: Reverts a previous commit
-            - style: changes that do not affect the meaning of the code
-            (white-space, formatting, missing semi-colons, etc)
-            - test: add, update, correct unit tests
-            - other: Changes that don't fit into the above categories
-
-            Scope: Select the most specific of application name, file name,
-            class name, method/function name, or feature name for the commit
-            scope. If in doubt, use the name of the file being modified. *Scope
-            is not optional.*
-
-            Breaking Changes: Include a `BREAKING CHANGE:` footer or append !
-            after type/scope for commits that introduce breaking changes.
-            Breaking change is the only footer permitted. Do not add
-            "Co-authored-by" or other footers unless explicitly requested.
-
-            Ensure the commit message is accurate, relevant, and concise.
-            **REMEMBER: No more than 72 characters wide on any line of
-            content.**
-            """,
-            "pull_request_title": """
-            Generate a pull request title (72 characters or less) summarizing
-            the changes in the provided commit messages, focusing on the most
-            significant change or overall themes. Keep it high level.
-
-            Exclude conventional commit types, prefixes, contributor name,
-            scope, or formatting. Use clear, concise language, prioritizing
-            clarity over completeness. No leading or trailing punctuation.
-
-            Example input:
-            feat(login): Add error handling to login function
-            refactor(user): Update user registration
-            doc(README): Update README with contribution guidelines
-
-            Example output:
-            "Error handling, refactor user registration, and README update"
-
-            PLEASE NOTE: IT IS CRITICAL to keep the title length under 72
-            characters or this process will fail.
-
-            Commit messages: \"{diff}\"
-            """,
-            "pull_request_summary": """
-            Look at the conventional commit messages provided and generate a
-            concise pull request summary. Keep the summary specific and to the
-            point, avoiding unnecessary details.
-
-            Aim to use no more than 2 paragraphs of summary.
-
-            The reader is busy and must be able to read and understand the
-            content quickly & without fuss.
-
-            Content should be returned as markdown without headings or font
-            styling, bullet points and plain paragraph text are ok.
-
-            Commit messages: \"{diff}\"
-
-            IMPORTANT GUIDELINES:
-            1. The summary should be clear, concise, and informative.
-            2. Focus on the most significant changes and their impact.
-            3. Use bullet points for clarity if there are multiple distinct
-            changes.
-            4. Aim for 2-3 paragraphs maximum.
-            5. Avoid technical jargon unless absolutely necessary.
-            6. Explain why the changes were made, not just what was changed.
-            7. If there are breaking changes, clearly highlight them.
-            """,
-            "pull_request_context": """
-            Look at the conventional commit messages provided and generate a
-            concise context statement for the changes in the pull request that
-            clearly explains why the changes have been made.
-
-            IMPORTANT GUIDELINES:
-            1. Explain why these changes were necessary.
-            2. Use bullet points to list the main reasons for the changes,but
-            use as few as possible to keep the context concise.
-            3. Keep it brief but informative - aim for no more than 10 bullet
-            points.
-            4. Focus on the business or technical motivations behind the
-            changes.
-            5. If addressing any issues or bugs, mention them concisely.
-            6. Avoid technical implementation details unless crucial for
-            understanding the context.
-            7. Content should be returned as markdown without headings or font
-            styling, bullet points and plain paragraph text are ok.
-            8. Provide a context that helps reviewers understand the motivation
-            and importance of these changes.
-            9. The word context must be in the returned content.
-
-            Commit messages: \"{diff}\"
-            """,
-        }
+        self.templates = dict(TEMPLATES)
 
     def get_working_model(self) -> str:
         """Get a working model from the list of available models.
@@ -233,16 +277,49 @@ class LiteLLMTools:
         """
         return self.models[0]  # Always return the primary model for testing
 
+    def _build_messages(self, template_key: str, diff: str) -> list:
+        """Build the chat messages for the given template key and diff.
+
+        Args:
+            template_key (str): The key of the template to use.
+            diff (str): The diff to be used in the template.
+
+        Returns:
+            list: The system and user messages to send to the model.
+
+        Raises:
+            ValueError: If the specified template is not found.
+        """
+        template = self.templates.get(template_key)
+        if not template:
+            raise ValueError(f"Template '{template_key}' not found.")
+
+        max_diff_length = 10000
+        truncated_diff = diff[:max_diff_length]
+        role_user_content = template.format(diff=truncated_diff)
+
+        return [
+            {
+                "role": "system",
+                "content": self.templates["commit_message_system"],
+            },
+            {"role": "user", "content": role_user_content},
+        ]
+
     def generate_content(
             self,
             template_key: str,
-            diff: str
+            diff: str,
+            response_format: Optional[dict] = None
     ) -> Tuple[str, str]:
         """Generate content based on the given template key and diff.
 
         Args:
             template_key (str): The key of the template to use.
             diff (str): The diff to be used in the template.
+            response_format (Optional[dict]): The response format to request,
+            e.g. {"type": "json_object"}. It is dropped for models that do
+            not support it.
 
         Returns:
             Tuple[str, str]: A tuple containing the generated content and the
@@ -252,61 +329,120 @@ class LiteLLMTools:
             ValueError: If the specified template is not found or if content
             generation fails after retries.
         """
-        template = self.templates.get(template_key)
-        if not template:
-            raise ValueError(f"Template '{template_key}' not found.")
-
-        max_diff_length = 10000
-        truncated_diff = diff[:max_diff_length]
-        role_user_content = template.format(diff=truncated_diff)
-
-        retries = 3
-        for attempt in range(retries):
+        messages = self._build_messages(template_key, diff)
+        completion_kwargs = {}
+        if response_format is not None:
+            completion_kwargs = {
+                "response_format": response_format,
+                "drop_params": True,
+            }
+
+        attempt = 0
+        while True:
+            attempt += 1
             try:
                 model = self.get_working_model()
                 response = litellm.completion(
                     model=model,
-                    messages=[
-                        {
-                            "role": "system",
-                            "content": self.templates["commit_message_system"],
-                        },
-                        {"role": "user", "content": role_user_content},
-                    ],
+                    messages=messages,
+                    **completion_kwargs
                 )
-                generated_content = response.choices[0].message.content.strip()
-                return generated_content.replace("```", "").strip(), model
-            except (
-                AuthenticationError,
-                PermissionDeniedError,
-                ContentPolicyViolationError,
-            ) as e:
-                log_message.error(f"Critical error: {e}")
-                raise
-            except RateLimitError as e:
-                log_message.warning(f"Rate limit exceeded: {e}")
-                time.sleep(5)  # Wait longer for rate limit errors
-            except (
-                BadRequestError,
-                NotFoundError,
-                UnprocessableEntityError,
-                InternalServerError,
-                ContextWindowExceededError,
-                APIConnectionError,
-            ) as e:
-                log_message.warning(f"API error: {e}")
-
-            if attempt == retries - 1:
-                log_message.error(
-                    f"Failed to generate content after {retries} attempts"
+                return self._response_content(response), model
+            except (*_CRITICAL_ERRORS, *_RETRYABLE_ERRORS) as e:
+                time.sleep(self._retry_delay(e, attempt))
+
+    async def agenerate_content(
+            self,
+            template_key: str,
+            diff: str,
+            rate_limiter: Optional[RateLimiter] = None
+    ) -> Tuple[str, str]:
+        """Asynchronously generate content for a template key and diff.
+
+        This is the non-blocking counterpart of generate_content and uses
+        litellm.acompletion, so several prompts can be awaited concurrently
+        with asyncio.gather.
+
+        Args:
+            template_key (str): The key of the template to use.
+            diff (str): The diff to be used in the template.
+            rate_limiter (Optional[RateLimiter]): Rate limiter shared by the
+            concurrent requests, if any.
+
+        Returns:
+            Tuple[str, str]: A tuple containing the generated content and the
+            working model.
+
+        Raises:
+            ValueError: If the specified template is not found or if content
+            generation fails after retries.
+        """
+        messages = self._build_messages(template_key, diff)
+
+        attempt = 0
+        while True:
+            attempt += 1
+            try:
+                model = self.get_working_model()
+                response = await throttled_complete(
+                    rate_limiter,
+                    model=model,
+                    messages=messages
                 )
-                raise ValueError("Content generation failed after max retries")
-            time.sleep(2)
+                return self._response_content(response), model
+            except (*_CRITICAL_ERRORS, *_RETRYABLE_ERRORS) as e:
+                await asyncio.sleep(self._retry_delay(e, attempt))
 
-        raise ValueError(
-            "Unexpected error: Content generation failed without raising "
-            "an exception"
-        )
+    @staticmethod
+    def _response_content(response) -> str:
+        """Extract the generated text from a completion response.
+
+        Args:
+            response: The litellm completion response.
+
+        Returns:
+            str: The generated content with code fences removed.
+        """
+        generated_content = response.choices[0].message.content.strip()
+        return generated_content.replace("```", "").strip()
+
+    @staticmethod
+    def _retry_delay(error: Exception, attempt: int) -> float:
+        """Decide how a failed generation attempt should be retried.
+
+        This is the retry policy shared by generate_content and
+        agenerate_content.
+
+        Args:
+            error (Exception): The error raised by the completion call.
+            attempt (int): The number of the attempt that failed, from 1.
+
+        Returns:
+            float: The number of seconds to wait before the next attempt.
+
+        Raises:
+            Exception: The original error if it is critical.
+            ValueError: If no attempts remain.
+        """
+        if isinstance(error, _CRITICAL_ERRORS):
+            log_message.error(f"Critical error: {error}")
+            raise error
+
+        if isinstance(error, RateLimitError):
+            log_message.warning(f"Rate limit exceeded: {error}")
+            delay = 7  # Wait longer for rate limit errors
+        else:
+            log_message.warning(f"API error: {error}")
+            delay = 2
+
+        if attempt >= GENERATION_RETRIES:
+            log_message.error(
+                f"Failed to generate content after {attempt} attempts"
+            )
+            raise ValueError(
+                "Content generation failed after max retries"
+            ) from error
+        return delay
 
     def format_message(self, message: str) -> str:
         """Format a commit message.
@@ -525,21 +661,25 @@ class LiteLLMTools:
 
         return None
 
-    def generate_pull_request_summary(self) -> Optional[str]:
+    def generate_pull_request_summary(
+            self,
+            diff: Optional[str] = None
+    ) -> Optional[str]:
         """Generate a summary for a pull request.
 
         Args:
-            dryrun (bool, optional): Whether this is a dry run. Defaults to
-            False.
+            diff (Optional[str]): The commit log to generate from. When not
+            provided the commit log against 'origin/release' is fetched.
 
         Returns:
             Optional[str]: The generated pull request summary, or None if an
             error occurred.
         """
         try:
-            commits = get_commit_log("origin/release").stdout
+            if diff is None:
+                diff = get_commit_log("origin/release").stdout
             generated_summary, _ = self.generate_content(
-                "pull_request_summary", commits
+                "pull_request_summary", diff
             )
             return generated_summary
         except subprocess.CalledProcessError as e:
@@ -548,21 +688,25 @@ class LiteLLMTools:
             log_message.error(f"Error generating PR summary: {e}")
         return None
 
-    def generate_pull_request_context(self) -> Optional[str]:
+    def generate_pull_request_context(
+            self,
+            diff: Optional[str] = None
+    ) -> Optional[str]:
         """Generate context for a pull request.
 
         Args:
-            dryrun (bool, optional): Whether this is a dry run. Defaults to
-            False.
+            diff (Optional[str]): The commit log to generate from. When not
+            provided the commit log against 'origin/release' is fetched.
 
         Returns:
             Optional[str]: The generated pull request context, or None if an
             error occurred.
         """
         try:
-            commits = get_commit_log("origin/release").stdout
+            if diff is None:
+                diff = get_commit_log("origin/release").stdout
             generated_context, _ = self.generate_content(
-                "pull_request_context", commits
+                "pull_request_context", diff
             )
             return generated_context
         except subprocess.CalledProcessError as e:
@@ -571,6 +715,51 @@ class LiteLLMTools:
             log_message.error(f"Error generating PR context: {e}")
         return None
 
+    def generate_pr_bundle(self, diff: Optional[str] = None) -> dict:
+        """Generate the pull request title, summary and context in one call.
+
+        The commit log is sent to the model once and a JSON object holding
+        every component is requested, rather than paying for the same prompt
+        once per component.
+
+        Args:
+            diff (Optional[str]): The commit log to generate from. When not
+            provided the commit log against 'origin/release' is fetched.
+
+        Returns:
+            dict: The generated content keyed by "title", "summary" and
+            "context". The title is formatted with format_pr_title.
+
+        Raises:
+            ValueError: If generation fails or the model does not return a
+            JSON object holding every component.
+        """
+        if diff is None:
+            diff = get_commit_log("origin/release").stdout
+        content, _ = self.generate_content(
+            "pull_request_bundle",
+            diff,
+            response_format={"type": "json_object"}
+        )
+
+        # Ignore anything, such as a code fence, around the JSON object
+        start, end = content.find("{"), content.rfind("}") + 1
+        try:
+            bundle = json.loads(content[start:end])
+        except json.JSONDecodeError as e:
+            raise ValueError(f"Invalid PR bundle JSON: {e}") from e
+
+        if not isinstance(bundle, dict) or not all(
+            isinstance(bundle.get(key), str) for key in PR_BUNDLE_KEYS
+        ):
+            raise ValueError(
+                f"PR bundle must contain the keys: {', '.join(PR_BUNDLE_KEYS)}"
+            )
+
+        bundle = {key: bundle[key].strip() for key in PR_BUNDLE_KEYS}
+        bundle["title"] = self.format_pr_title(bundle["title"])
+        return bundle
+
     def generate_release_body(self, diff: str, dryrun: bool = False) -> str:
         """Generate a release body based on the given diff.
 
@@ -602,8 +791,3 @@ class LiteLLMTools:
         except ValueError as e:
             log_message.error(f"Error generating release body: {e}")
             return "Release Body Generation Failed"
-
-
-# Initialize tools
-tools = LiteLLMTools(debug=True)
-# Add the litellm_tools module content here
@@ -0,0 +1,173 @@
+# klingon_tools/llm_templates.py
+"""Prompt templates and default models used by LiteLLMTools.
+
+These live apart from litellm_tools so callers that only need to identify
+generated content, such as the PR cache in entrypoints, can do so without
+importing LiteLLM.
+"""
+
+# The model LiteLLMTools uses unless another is requested
+DEFAULT_MODEL_PRIMARY = "gpt-4o-mini"
+
+# The fallback model LiteLLMTools uses unless another is requested
+DEFAULT_MODEL_SECONDARY = "claude-3-haiku-20240307"
+
+# Prompt templates keyed by the name passed to LiteLLMTools.generate_content
+TEMPLATES = {
+    "commit_message_system": """
+    You are an AI assistant specialized in generating clear, concise,
+    and informative git commit messages, pull request titles, contexts
+    and summaries.
+
+    Your task is to analyze code diffs and produce git repository
+    documentation that accurately reflect the changes made.
+
+    Follow best practices for commit messages, including using the
+    Conventional Commits format when appropriate.
+
+    When provided with message length or column widths, **they are
+    mandatory and must not be exceeded.**
+
+    Return all results as raw plain text containing only the answer
+    unless otherwise specified.
+    """,
+    "commit_message_user": """
+    Generate a git commit message based on these diffs: "{diff}"
+
+    Follow the Conventional Commits standard using the following
+    format:
+    <type>(scope): <description>
+
+    [optional body]
+
+    [optional footer(s)]
+
+    The first line of a conventional commit must not exceed 72
+    characters and must be followed by a blank line. The body and
+    footer are both optional but must be separated by a blank line if
+    present and also must not exceed 72 characters.
+
+    Consider the following options when selecting commit types:
+    - build: updates to build system & external dependencies
+    - chore: changes that don't modify src or test files
+    - ci: changes to CI configuration files and scripts
+    - docs: updates to documentation & comments
+    - feat: add new feature or function to the codebase
+    - fix: correct bugs and other errors in code
+    - perf: improve performance without changing existing functionality
+    - refactor: code changes that neither fix bugs nor add features
+    - revert: Reverts a previous commit
+    - style: changes that do not affect the meaning of the code
+    (white-space, formatting, missing semi-colons, etc)
+    - test: add, update, correct unit tests
+    - other: Changes that don't fit into the above categories
+
+    Scope: Select the most specific of application name, file name,
+    class name, method/function name, or feature name for the commit
+    scope. If in doubt, use the name of the file being modified. *Scope
+    is not optional.*
+
+    Breaking Changes: Include a `BREAKING CHANGE:` footer or append !
+    after type/scope for commits that introduce breaking changes.
+    Breaking change is the only footer permitted. Do not add
+    "Co-authored-by" or other footers unless explicitly requested.
+
+    Ensure the commit message is accurate, relevant, and concise.
+    **REMEMBER: No more than 72 characters wide on any line of
+    content.**
+    """,
+    "pull_request_title": """
+    Generate a pull request title (72 characters or less) summarizing
+    the changes in the provided commit messages, focusing on the most
+    significant change or overall themes. Keep it high level.
+
+    Exclude conventional commit types, prefixes, contributor name,
+    scope, or formatting. Use clear, concise language, prioritizing
+    clarity over completeness. No leading or trailing punctuation.
+
+    Example input:
+    feat(login): Add error handling to login function
+    refactor(user): Update user registration
+    doc(README): Update README with contribution guidelines
+
+    Example output:
+    "Error handling, refactor user registration, and README update"
+
+    PLEASE NOTE: IT IS CRITICAL to keep the title length under 72
+    characters or this process will fail.
+
+    Commit messages: \"{diff}\"
+    """,
+    "pull_request_summary": """
+    Look at the conventional commit messages provided and generate a
+    concise pull request summary. Keep the summary specific and to the
+    point, avoiding unnecessary details.
+
+    Aim to use no more than 2 paragraphs of summary.
+
+    The reader is busy and must be able to read and understand the
+    content quickly & without fuss.
+
+    Content should be returned as markdown without headings or font
+    styling, bullet points and plain paragraph text are ok.
+
+    Commit messages: \"{diff}\"
+
+    IMPORTANT GUIDELINES:
+    1. The summary should be clear, concise, and informative.
+    2. Focus on the most significant changes and their impact.
+    3. Use bullet points for clarity if there are multiple distinct
+    changes.
+    4. Aim for 2-3 paragraphs maximum.
+    5. Avoid technical jargon unless absolutely necessary.
+    6. Explain why the changes were made, not just what was changed.
+    7. If there are breaking changes, clearly highlight them.
+    """,
+    "pull_request_context": """
+    Look at the conventional commit messages provided and generate a
+    concise context statement for the changes in the pull request that
+    clearly explains why the changes have been made.
+
+    IMPORTANT GUIDELINES:
+    1. Explain why these changes were necessary.
+    2. Use bullet points to list the main reasons for the changes,but
+    use as few as possible to keep the context concise.
+    3. Keep it brief but informative - aim for no more than 10 bullet
+    points.
+    4. Focus on the business or technical motivations behind the
+    changes.
+    5. If addressing any issues or bugs, mention them concisely.
+    6. Avoid technical implementation details unless crucial for
+    understanding the context.
+    7. Content should be returned as markdown without headings or font
+    styling, bullet points and plain paragraph text are ok.
+    8. Provide a context that helps reviewers understand the motivation
+    and importance of these changes.
+    9. The word context must be in the returned content.
+
+    Commit messages: \"{diff}\"
+    """,
+    "pull_request_bundle": """
+    Look at the conventional commit messages provided and generate the
+    title, summary and context for a pull request containing them.
+
+    Return a JSON object with exactly these string keys:
+    - "title": A pull request title of 72 characters or less
+    summarizing the most significant change or overall themes.
+    Exclude conventional commit types, prefixes, contributor name,
+    scope, or formatting. No leading or trailing punctuation.
+    - "summary": A concise summary of no more than 2 paragraphs
+    focusing on the most significant changes and their impact, and
+    why they were made. Clearly highlight any breaking changes.
+    - "context": A brief context statement, using as few bullet
+    points as possible (no more than 10), explaining the business or
+    technical motivations for the changes. The word context must be
+    in the returned content.
+
+    The summary and context should be markdown without headings or
+    font styling, bullet points and plain paragraph text are ok.
+    Return only the JSON object.
+
+    Commit messages: \"{diff}\"
+    """,
+}
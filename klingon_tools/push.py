@@ -496,7 +496,9 @@ def workflow_process_file(
 
     This function stages the file, generates a commit message, runs pre-commit
     hooks, and commits the file if all checks pass.
-    It also handles auto-fixed commit messages by re-staging and re-processing.
+    An auto-fixed commit message is only used if it passes validation itself.
+    Otherwise the file is unstaged and a new message is generated, up to
+    max_retries times.
 
     Args:
         file_name: The name of the file to process.
@@ -506,7 +508,7 @@ def workflow_process_file(
         log_message: The logging function to use for output.
         litellm_tools: The LiteLLM tools object.
         file_counter: The current file counter.
-        max_retries: Maximum number of auto-fix attempts.
+        max_retries: Maximum number of commit message attempts.
 
     Raises:
         SystemExit: If pre-commit hooks fail.
@@ -540,7 +542,18 @@ def workflow_process_file(
             file_name=file_name, repo=current_repo)
 
         # Validate the commit message
-        is_valid = validate_commit_message(commit_message, log_message)
+        is_valid, fixed_message = validate_commit_message(
+            commit_message, log_message)
+
+        # Only use an auto-fixed message if it passes validation itself
+        if not is_valid and fixed_message:
+            is_valid, _ = validate_commit_message(fixed_message, log_message)
+            if is_valid:
+                log_message.info(
+                    "Using auto-fixed commit message",
+                    status="🔧"
+                )
+                commit_message = fixed_message
 
         if is_valid:
             # Run pre-commit hooks
@@ -570,9 +583,11 @@ def workflow_process_file(
                 git_get_status(current_repo)
                 log_git_stats(*git_get_status(current_repo))
             return  # Exit after successful processing
-        else:
-            log_message.error("Commit message validation failed.", status="❌")
-            return
+
+        log_message.error("Commit message validation failed.", status="❌")
+        # Unstage the file so the next commit doesn't pick it up, then
+        # generate a new commit message on the next attempt
+        current_repo.git.reset("-q", "--", file_name)
 
     # If max retries exceeded
     log_message.error(
@@ -7,11 +7,13 @@ It includes tests for various GitHub pull request component generation
 functions from the entrypoints module.
 """
 
+import json
 import os
+import subprocess
 import sys
 import pytest
 import warnings
-from unittest.mock import patch, MagicMock
+from unittest.mock import patch, AsyncMock, MagicMock
 from io import StringIO
 
 # Add the parent directory to sys.path to import entrypoints
@@ -29,8 +31,41 @@ warnings.filterwarnings(
 )
 
 
-@patch("klingon_tools.entrypoints.get_commit_log")
-@patch("klingon_tools.entrypoints.LiteLLMTools")
+TEST_BUNDLE = {
+    "title": "Test PR Title",
+    "summary": "Test PR Summary",
+    "context": "Test PR Context",
+}
+
+
+@pytest.fixture(autouse=True)
+def disable_pr_cache(monkeypatch):
+    """Keep tests from reading or writing the on-disk PR cache."""
+    monkeypatch.setenv("KLINGON_TOOLS_NO_CACHE", "1")
+
+
+@pytest.fixture
+def pr_cache(monkeypatch, tmp_path):
+    """Enable the PR cache in a temporary directory."""
+    monkeypatch.delenv("KLINGON_TOOLS_NO_CACHE")
+    monkeypatch.setattr(entrypoints, "PR_CACHE_DIR", str(tmp_path))
+    monkeypatch.setattr(
+        entrypoints, "_pr_commit_range", lambda: "/repo\nbase\nhead")
+    return tmp_path
+
+
+@pytest.fixture(autouse=True)
+def clear_commit_log_cache():
+    """Clear the memoized commit log between tests."""
+    entrypoints._cached_commit_log.cache_clear()
+    entrypoints._pr_commit_range.cache_clear()
+    yield
+    entrypoints._cached_commit_log.cache_clear()
+    entrypoints._pr_commit_range.cache_clear()
+
+
+@patch("klingon_tools.git_log_helper.get_commit_log")
+@patch("klingon_tools.litellm_tools.LiteLLMTools")
 def test_gh_pr_gen_title(mock_litellm_tools, mock_get_commit_log):
     """
     Test the gh_pr_gen_title function.
@@ -42,66 +77,414 @@ def test_gh_pr_gen_title(mock_litellm_tools, mock_get_commit_log):
         - Asserts that the function returns 0.
         - Asserts that the generated pull request title is in the output.
         - Asserts that get_commit_log is called once with the correct argument.
-        - Asserts that generate_pull_request_title is called once with the
-          correct arguments.
+        - Asserts that generate_pr_bundle is called once with the correct
+          arguments.
 
     Args:
         mock_litellm_tools (MagicMock): Mock for LiteLLMTools.
         mock_get_commit_log (MagicMock): Mock for get_commit_log function.
     """
     mock_get_commit_log.return_value = MagicMock(stdout="Test commit log")
-    mock_litellm_tools.return_value.\
-        generate_pull_request_title.\
-        return_value = "Test PR Title"
+    mock_litellm_tools.return_value.generate_pr_bundle.return_value = (
+        TEST_BUNDLE)
 
     with patch("sys.stdout", new=StringIO()) as fake_out:
         result = entrypoints.gh_pr_gen_title()
 
     assert result == 0
     assert "Test PR Title" in fake_out.getvalue()
+    assert "Test PR Summary" not in fake_out.getvalue()
     mock_get_commit_log.assert_called_once_with("origin/release")
-    mock_litellm_tools.return_value.generate_pull_request_title.\
+    mock_litellm_tools.return_value.generate_pr_bundle.\
         assert_called_once_with("Test commit log")
 
 
-@patch("klingon_tools.entrypoints.LiteLLMTools")
-def test_gh_pr_gen_summary(mock_litellm_tools):
+@patch("klingon_tools.git_log_helper.get_commit_log")
+@patch("klingon_tools.litellm_tools.LiteLLMTools")
+def test_gh_pr_gen_summary(mock_litellm_tools, mock_get_commit_log):
     """
     Test the gh_pr_gen_summary function.
 
     Args:
         mock_litellm_tools (MagicMock): Mock for LiteLLMTools.
+        mock_get_commit_log (MagicMock): Mock for get_commit_log function.
     """
-    mock_litellm_tools.return_value.generate_pull_request_summary.\
-        return_value = "Test PR Summary"
+    mock_get_commit_log.return_value = MagicMock(stdout="Test commit log")
+    mock_litellm_tools.return_value.generate_pr_bundle.return_value = (
+        TEST_BUNDLE)
 
     with patch("sys.stdout", new=StringIO()) as fake_out:
         result = entrypoints.gh_pr_gen_summary()
 
     assert result == 0
     assert "Test PR Summary" in fake_out.getvalue()
-    mock_litellm_tools.return_value.generate_pull_request_summary.\
-        assert_called_once_with()
+    mock_get_commit_log.assert_called_once_with("origin/release")
+    mock_litellm_tools.return_value.generate_pr_bundle.\
+        assert_called_once_with("Test commit log")
 
 
-@patch("klingon_tools.entrypoints.LiteLLMTools")
-def test_gh_pr_gen_context(mock_litellm_tools):
+@patch("klingon_tools.git_log_helper.get_commit_log")
+@patch("klingon_tools.litellm_tools.LiteLLMTools")
+def test_gh_pr_gen_context(mock_litellm_tools, mock_get_commit_log):
     """
     Test the gh_pr_gen_context function.
 
     Args:
         mock_litellm_tools (MagicMock): Mock for LiteLLMTools.
+        mock_get_commit_log (MagicMock): Mock for get_commit_log function.
     """
-    mock_litellm_tools.return_value.generate_pull_request_context.\
-        return_value = "Test PR Context"
+    mock_get_commit_log.return_value = MagicMock(stdout="Test commit log")
+    mock_litellm_tools.return_value.generate_pr_bundle.return_value = (
+        TEST_BUNDLE)
 
     with patch("sys.stdout", new=StringIO()) as fake_out:
         result = entrypoints.gh_pr_gen_context()
 
     assert result == 0
     assert "Test PR Context" in fake_out.getvalue()
-    mock_litellm_tools.return_value.generate_pull_request_context.\
-        assert_called_once_with()
+    mock_get_commit_log.assert_called_once_with("origin/release")
+    mock_litellm_tools.return_value.generate_pr_bundle.\
+        assert_called_once_with("Test commit log")
+
+
+@patch("klingon_tools.git_log_helper.get_commit_log")
+@patch("klingon_tools.litellm_tools.LiteLLMTools")
+def test_gh_pr_gen_all(mock_litellm_tools, mock_get_commit_log):
+    """
+    Test the gh_pr_gen_all function.
+
+    Args:
+        mock_litellm_tools (MagicMock): Mock for LiteLLMTools.
+        mock_get_commit_log (MagicMock): Mock for get_commit_log function.
+    """
+    mock_get_commit_log.return_value = MagicMock(stdout="Test commit log")
+    mock_tools = mock_litellm_tools.return_value
+    mock_tools.agenerate_content = AsyncMock(
+        side_effect=lambda template_key, *args: (f"Test {template_key}", "m")
+    )
+    mock_tools.format_pr_title.side_effect = lambda title: title.upper()
+
+    with patch("sys.stdout", new=StringIO()) as fake_out:
+        result = entrypoints.gh_pr_gen_all()
+
+    assert result == 0
+    output = fake_out.getvalue()
+    assert "TEST PULL_REQUEST_TITLE" in output
+    assert "Test pull_request_summary" in output
+    assert "Test pull_request_context" in output
+    mock_get_commit_log.assert_called_once_with("origin/release")
+    mock_litellm_tools.assert_called_once_with()
+    assert mock_tools.agenerate_content.await_count == 3
+
+
+@patch("klingon_tools.git_log_helper.get_commit_log")
+@patch("klingon_tools.litellm_tools.LiteLLMTools")
+def test_gh_pr_gen_all_partial_failure(
+    mock_litellm_tools,
+    mock_get_commit_log
+):
+    """
+    Test that gh_pr_gen_all reports failure when a component fails.
+
+    Args:
+        mock_litellm_tools (MagicMock): Mock for LiteLLMTools.
+        mock_get_commit_log (MagicMock): Mock for get_commit_log function.
+    """
+    mock_get_commit_log.return_value = MagicMock(stdout="Test commit log")
+
+    async def fake_generate(template_key, *args):
+        if template_key == "pull_request_context":
+            raise ValueError("Content generation failed after max retries")
+        return f"Test {template_key}", "m"
+
+    mock_tools = mock_litellm_tools.return_value
+    mock_tools.agenerate_content = fake_generate
+    mock_tools.format_pr_title.side_effect = lambda title: title
+
+    with patch("sys.stdout", new=StringIO()) as fake_out:
+        result = entrypoints.gh_pr_gen_all()
+
+    assert result == 1
+    assert "Test pull_request_summary" in fake_out.getvalue()
+    assert "Test pull_request_context" not in fake_out.getvalue()
+
+
+@patch("klingon_tools.git_log_helper.get_commit_log")
+@patch("klingon_tools.litellm_tools.LiteLLMTools")
+def test_commit_log_fetched_once(mock_litellm_tools, mock_get_commit_log):
+    """
+    Test that generating several PR components runs git log only once.
+
+    Args:
+        mock_litellm_tools (MagicMock): Mock for LiteLLMTools.
+        mock_get_commit_log (MagicMock): Mock for get_commit_log function.
+    """
+    mock_get_commit_log.return_value = MagicMock(stdout="Test commit log")
+    mock_litellm_tools.return_value.generate_pr_bundle.return_value = (
+        TEST_BUNDLE)
+
+    with patch("sys.stdout", new=StringIO()):
+        assert entrypoints.gh_pr_gen_title() == 0
+        assert entrypoints.gh_pr_gen_summary() == 0
+        assert entrypoints.gh_pr_gen_context() == 0
+
+    mock_get_commit_log.assert_called_once_with("origin/release")
+
+
+@patch("klingon_tools.git_log_helper.get_commit_log")
+@patch("klingon_tools.litellm_tools.LiteLLMTools")
+def test_gh_pr_gen_bundle_cached(
+    mock_litellm_tools,
+    mock_get_commit_log,
+    pr_cache
+):
+    """
+    Test that the cached PR bundle serves every component without calling
+    the LLM again.
+
+    Args:
+        mock_litellm_tools (MagicMock): Mock for LiteLLMTools.
+        mock_get_commit_log (MagicMock): Mock for get_commit_log function.
+        pr_cache (Path): Temporary PR cache directory.
+    """
+    mock_get_commit_log.return_value = MagicMock(stdout="Test commit log")
+    mock_litellm_tools.return_value.generate_pr_bundle.return_value = (
+        TEST_BUNDLE)
+
+    with patch("sys.stdout", new=StringIO()) as fake_out:
+        assert entrypoints.gh_pr_gen_title() == 0
+        assert entrypoints.gh_pr_gen_title() == 0
+        assert entrypoints.gh_pr_gen_summary() == 0
+        assert entrypoints.gh_pr_gen_context() == 0
+
+    assert fake_out.getvalue().count("Test PR Title") == 2
+    assert "Test PR Summary" in fake_out.getvalue()
+    assert "Test PR Context" in fake_out.getvalue()
+    mock_litellm_tools.return_value.generate_pr_bundle.\
+        assert_called_once_with("Test commit log")
+
+
+@patch("klingon_tools.git_log_helper.get_commit_log")
+@patch("klingon_tools.litellm_tools.LiteLLMTools")
+def test_gh_pr_gen_summary_failure_not_cached(
+    mock_litellm_tools,
+    mock_get_commit_log,
+    pr_cache
+):
+    """
+    Test that a failed PR bundle generation is not cached.
+
+    Args:
+        mock_litellm_tools (MagicMock): Mock for LiteLLMTools.
+        mock_get_commit_log (MagicMock): Mock for get_commit_log function.
+        pr_cache (Path): Temporary PR cache directory.
+    """
+    mock_get_commit_log.return_value = MagicMock(stdout="Test commit log")
+    mock_tools = mock_litellm_tools.return_value
+    mock_tools.generate_pr_bundle.side_effect = [
+        ValueError("Invalid PR bundle JSON"), TEST_BUNDLE
+    ]
+
+    with patch("sys.stdout", new=StringIO()) as fake_out:
+        assert entrypoints.gh_pr_gen_summary() == 1
+        assert entrypoints.gh_pr_gen_summary() == 0
+        assert entrypoints.gh_pr_gen_summary() == 0
+
+    assert fake_out.getvalue().count("Test PR Summary") == 2
+    assert mock_tools.generate_pr_bundle.call_count == 2
+
+
+@patch("klingon_tools.git_log_helper.get_commit_log")
+@patch("klingon_tools.litellm_tools.LiteLLMTools")
+def test_gh_pr_gen_all_uses_cache(
+    mock_litellm_tools,
+    mock_get_commit_log,
+    pr_cache
+):
+    """
+    Test that gh_pr_gen_all only generates components missing from the cache.
+
+    Args:
+        mock_litellm_tools (MagicMock): Mock for LiteLLMTools.
+        mock_get_commit_log (MagicMock): Mock for get_commit_log function.
+        pr_cache (Path): Temporary PR cache directory.
+    """
+    mock_get_commit_log.return_value = MagicMock(stdout="Test commit log")
+    mock_tools = mock_litellm_tools.return_value
+    mock_tools.agenerate_content = AsyncMock(
+        side_effect=lambda template_key, *args: (f"Test {template_key}", "m")
+    )
+    entrypoints._pr_cache_set(
+        "pull_request_title", "Test commit log", "Test PR Title")
+
+    with patch("sys.stdout", new=StringIO()) as fake_out:
+        assert entrypoints.gh_pr_gen_all() == 0
+        assert entrypoints.gh_pr_gen_all() == 0
+
+    output = fake_out.getvalue()
+    assert output.count("Test PR Title") == 2
+    assert output.count("Test pull_request_summary") == 2
+    assert mock_tools.agenerate_content.await_count == 2
+    templates = {
+        call.args[0] for call in mock_tools.agenerate_content.await_args_list
+    }
+    assert templates == {"pull_request_summary", "pull_request_context"}
+
+
+@patch("klingon_tools.git_log_helper.get_commit_log")
+@patch("klingon_tools.litellm_tools.LiteLLMTools")
+def test_gh_pr_gen_bundle(mock_litellm_tools, mock_get_commit_log):
+    """
+    Test that gh_pr_gen_bundle prints every component as JSON.
+
+    Args:
+        mock_litellm_tools (MagicMock): Mock for LiteLLMTools.
+        mock_get_commit_log (MagicMock): Mock for get_commit_log function.
+    """
+    mock_get_commit_log.return_value = MagicMock(stdout="Test commit log")
+    mock_litellm_tools.return_value.generate_pr_bundle.return_value = (
+        TEST_BUNDLE)
+
+    with patch("sys.stdout", new=StringIO()) as fake_out:
+        result = entrypoints.gh_pr_gen_bundle()
+
+    assert result == 0
+    assert json.loads(fake_out.getvalue()) == TEST_BUNDLE
+
+
+@patch("klingon_tools.git_log_helper.get_commit_log")
+@patch("klingon_tools.litellm_tools.LiteLLMTools")
+def test_bundle_and_all_cached_separately(
+    mock_litellm_tools,
+    mock_get_commit_log,
+    pr_cache
+):
+    """
+    Test that gh_pr_gen_all results are never served as bundle components.
+
+    Args:
+        mock_litellm_tools (MagicMock): Mock for LiteLLMTools.
+        mock_get_commit_log (MagicMock): Mock for get_commit_log function.
+        pr_cache (Path): Temporary PR cache directory.
+    """
+    mock_get_commit_log.return_value = MagicMock(stdout="Test commit log")
+    mock_tools = mock_litellm_tools.return_value
+    mock_tools.agenerate_content = AsyncMock(
+        side_effect=lambda template_key, *args: (f"Test {template_key}", "m")
+    )
+    mock_tools.format_pr_title.side_effect = lambda title: title
+    mock_tools.generate_pr_bundle.return_value = TEST_BUNDLE
+
+    with patch("sys.stdout", new=StringIO()) as fake_out:
+        assert entrypoints.gh_pr_gen_all() == 0
+        assert entrypoints.gh_pr_gen_title() == 0
+        assert entrypoints.gh_pr_gen_summary() == 0
+
+    output = fake_out.getvalue()
+    assert "Test PR Title" in output
+    assert "Test PR Summary" in output
+    mock_tools.generate_pr_bundle.assert_called_once_with("Test commit log")
+
+
+@patch("klingon_tools.git_log_helper.get_commit_log")
+@patch("klingon_tools.litellm_tools.LiteLLMTools")
+def test_empty_commit_log_not_cached(
+    mock_litellm_tools,
+    mock_get_commit_log,
+    pr_cache
+):
+    """
+    Test that nothing is cached when there is no commit log to key on.
+
+    Args:
+        mock_litellm_tools (MagicMock): Mock for LiteLLMTools.
+        mock_get_commit_log (MagicMock): Mock for get_commit_log function.
+        pr_cache (Path): Temporary PR cache directory.
+    """
+    mock_get_commit_log.return_value = MagicMock(stdout="")
+    mock_tools = mock_litellm_tools.return_value
+    mock_tools.generate_pr_bundle.return_value = TEST_BUNDLE
+
+    with patch("sys.stdout", new=StringIO()):
+        assert entrypoints.gh_pr_gen_title() == 0
+        assert entrypoints.gh_pr_gen_title() == 0
+
+    assert mock_tools.generate_pr_bundle.call_count == 2
+
+
+def test_pr_cache_key(monkeypatch):
+    """
+    Test that the PR cache key covers the commit range, model and template.
+    """
+    monkeypatch.setattr(
+        entrypoints, "TEMPLATES",
+        {"pull_request_title": "Title", "other": "Title"})
+    monkeypatch.setattr(entrypoints, "_pr_commit_range", lambda: "/a\nb\nc")
+    key = entrypoints._pr_cache_key("pull_request_title", "log")
+
+    assert key == entrypoints._pr_cache_key("pull_request_title", "log")
+    assert key != entrypoints._pr_cache_key("other", "log")
+
+    entrypoints.TEMPLATES["pull_request_title"] = "New title template"
+    assert key != entrypoints._pr_cache_key("pull_request_title", "log")
+    entrypoints.TEMPLATES["pull_request_title"] = "Title"
+
+    monkeypatch.setattr(entrypoints, "_pr_commit_range", lambda: "/d\nb\nc")
+    assert key != entrypoints._pr_cache_key("pull_request_title", "log")
+    monkeypatch.setattr(entrypoints, "_pr_commit_range", lambda: "/a\nb\nc")
+
+    monkeypatch.setattr(
+        entrypoints, "DEFAULT_MODEL_PRIMARY", "claude-3-haiku-20240307")
+    assert key != entrypoints._pr_cache_key("pull_request_title", "log")
+
+
+def test_pr_cache_hit_does_not_import_litellm(pr_cache):
+    """
+    Test that serving the PR bundle from the cache does not load LiteLLM.
+    """
+    entrypoints._pr_cache_set(
+        "pull_request_bundle", "Test commit log", TEST_BUNDLE)
+    code = (
+        "import sys\n"
+        "from unittest.mock import MagicMock\n"
+        "from klingon_tools import entrypoints\n"
+        f"entrypoints.PR_CACHE_DIR = {str(pr_cache)!r}\n"
+        "entrypoints._pr_commit_range = lambda: '/repo\\nbase\\nhead'\n"
+        "entrypoints._cached_commit_log = "
+        "lambda ref: MagicMock(stdout='Test commit log')\n"
+        "assert entrypoints.gh_pr_gen_title() == 0\n"
+        "assert 'klingon_tools.litellm_tools' not in sys.modules\n"
+        "assert 'litellm' not in sys.modules\n"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        capture_output=True,
+        text=True,
+        check=False,
+    )
+
+    assert result.returncode == 0, result.stderr
+    assert result.stdout.strip() == "Test PR Title"
+
+
+def test_entrypoints_import_is_lazy():
+    """
+    Test that importing entrypoints does not load LiteLLM or git helpers.
+    """
+    code = (
+        "import sys\n"
+        "import klingon_tools.entrypoints\n"
+        "assert 'klingon_tools.litellm_tools' not in sys.modules\n"
+        "assert 'klingon_tools.git_log_helper' not in sys.modules\n"
+        "assert 'litellm' not in sys.modules\n"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        capture_output=True,
+        text=True,
+        check=False,
+    )
+    assert result.returncode == 0, result.stderr
 
 
 if __name__ == "__main__":
@@ -0,0 +1,47 @@
+"""Unit tests for the git_commit_index module."""
+
+import pytest
+from unittest.mock import Mock
+from git import GitCommandError, Repo
+from klingon_tools.git_commit_index import git_commit_index
+
+
+@pytest.fixture
+def repo(tmp_path):
+    """Creates a Git repository with a single commit."""
+    repo = Repo.init(tmp_path)
+    with repo.config_writer() as config:
+        config.set_value("user", "name", "Test User")
+        config.set_value("user", "email", "test@example.com")
+    (tmp_path / "file1.txt").write_text("file1\n")
+    (tmp_path / "file2.txt").write_text("file2\n")
+    repo.index.add(["file1.txt", "file2.txt"])
+    repo.index.commit("feat(test): Initial commit")
+    return repo
+
+
+def test_git_commit_index(repo):
+    """Tests that git_commit_index commits the staged index."""
+    parent = repo.head.commit
+    repo.index.remove(["file1.txt"], working_tree=True)
+
+    git_commit_index(repo, "chore(cleanup): Cleanup 1 deleted item(s)")
+
+    commit = repo.head.commit
+    assert commit.message.strip() == (
+        "chore(cleanup): Cleanup 1 deleted item(s)")
+    assert commit.parents == (parent,)
+    assert [blob.path for blob in commit.tree.blobs] == ["file2.txt"]
+    assert not repo.is_dirty()
+
+
+def test_git_commit_index_fallback():
+    """Tests git_commit_index falls back to repo.index.commit on failure."""
+    mock_repo = Mock(spec=Repo)
+    mock_repo.git.write_tree.side_effect = GitCommandError("write-tree", 128)
+
+    git_commit_index(mock_repo, "chore(cleanup): Cleanup 1 deleted item(s)")
+
+    mock_repo.git.update_ref.assert_not_called()
+    mock_repo.index.commit.assert_called_once_with(
+        "chore(cleanup): Cleanup 1 deleted item(s)")
@@ -5,8 +5,11 @@ It tests various functions related to commit message validation, including
 checking for signed-off messages, commit message structure, and formatting.
 """
 
+import importlib
+import sys
 import pytest
 import textwrap
+from klingon_tools import git_commit_validate
 from klingon_tools.git_commit_validate import (
     is_commit_message_signed_off,
     check_prefix,
@@ -47,6 +50,37 @@ def mock_log_message():
     return MockLogMessage()
 
 
+@pytest.fixture(params=["re", "re2"])
+def regex_engine(request, monkeypatch):
+    """Reload git_commit_validate with its patterns compiled by each engine."""
+    if request.param == "re":
+        # A None entry makes "import re2" raise ImportError
+        monkeypatch.setitem(sys.modules, "re2", None)
+    else:
+        pytest.importorskip("re2")
+    module = importlib.reload(git_commit_validate)
+    assert module._re.__name__ == request.param
+    yield module
+    monkeypatch.undo()
+    importlib.reload(git_commit_validate)
+
+
+def test_patterns_with_regex_engine(regex_engine, mock_log_message):
+    """Test the compiled patterns behave the same with re and re2."""
+    message = "feat(core): Add feature"
+    stripped, prefix, _ = regex_engine.check_prefix(
+        f"✨ {message}", mock_log_message)
+    assert (stripped, prefix.strip()) == (message, "✨")
+    assert regex_engine.check_type(message, mock_log_message)
+    assert regex_engine.check_scope(message, mock_log_message)
+    assert regex_engine.check_description(message, mock_log_message)
+    assert not regex_engine.check_scope("feat: No scope", mock_log_message)
+    assert regex_engine.is_commit_message_signed_off(
+        f"{message}\n\nSigned-off-by: John Doe <john@example.com>")
+    assert not regex_engine.is_commit_message_signed_off(
+        f"{message} Signed-off-by: John Doe <john@example.com>")
+
+
 def test_is_commit_message_signed_off():
     """Test the is_commit_message_signed_off function."""
     assert is_commit_message_signed_off(
@@ -55,6 +89,12 @@ def test_is_commit_message_signed_off():
     assert not is_commit_message_signed_off(
         "This is a commit without sign-off"
     )
+    assert not is_commit_message_signed_off(
+        "Mention Signed-off-by: John Doe <john@example.com> in the docs"
+    )
+    assert not is_commit_message_signed_off(
+        "This is a commit\n\nSigned-off-by: John Doe"
+    )
 
 
 def test_check_prefix(mock_log_message):
@@ -158,6 +198,15 @@ def test_check_footer(mock_log_message):
     assert not check_footer(invalid_footer, mock_log_message)
 
 
+def test_validate_commit_message_keeps_prefix(mock_log_message):
+    """Test that an auto-fixed commit message keeps its emoji prefix."""
+    header = "feat(core): " + "a" * 61
+    is_valid, fixed_message = validate_commit_message(
+        f"✨ {header}\n\nBody text", mock_log_message)
+    assert not is_valid
+    assert fixed_message == f"✨ feat(core):\n{'a' * 61}\n\nBody text"
+
+
 def test_fix_body_wrapping():
     """Test the fix_body_wrapping function."""
     long_body = ("This is a very long body that exceeds the 72 character "
@@ -0,0 +1,54 @@
+"""Unit tests for the git_dirty module."""
+
+import pytest
+from unittest.mock import MagicMock, patch
+from git import Repo
+from klingon_tools.git_dirty import git_is_dirty
+
+
+@pytest.fixture
+def repo(tmp_path):
+    """Creates a Git repository with a single clean commit."""
+    repo = Repo.init(tmp_path)
+    with repo.config_writer() as config:
+        config.set_value("user", "name", "Test User")
+        config.set_value("user", "email", "test@example.com")
+    (tmp_path / "file1.txt").write_text("file1\n")
+    repo.index.add(["file1.txt"])
+    repo.index.commit("feat(test): Initial commit")
+    return repo
+
+
+def test_git_is_dirty_calls():
+    """Tests git_is_dirty only lists untracked files when asked to."""
+    mock_repo = MagicMock()
+    with patch('klingon_tools.git_dirty.subprocess.run') as mock_run:
+        mock_run.return_value.returncode = 1
+        assert git_is_dirty(mock_repo)
+        mock_run.assert_called_once()
+
+        mock_run.reset_mock()
+        mock_run.return_value.returncode = 0
+        mock_run.return_value.stdout = "new_file.txt\n"
+        assert not git_is_dirty(mock_repo)
+        mock_run.assert_called_once()
+
+        mock_run.reset_mock()
+        assert git_is_dirty(mock_repo, include_untracked=True)
+        assert mock_run.call_count == 2
+
+        mock_run.return_value.stdout = ""
+        assert not git_is_dirty(mock_repo, include_untracked=True)
+
+
+def test_git_is_dirty(repo, tmp_path):
+    """Tests git_is_dirty agrees with repo.is_dirty on a real repository."""
+    assert not git_is_dirty(repo, include_untracked=True)
+
+    (tmp_path / "new_file.txt").write_text("new\n")
+    assert not git_is_dirty(repo)
+    assert git_is_dirty(repo, include_untracked=True)
+
+    (tmp_path / "new_file.txt").unlink()
+    (tmp_path / "file1.txt").write_text("changed\n")
+    assert git_is_dirty(repo)
@@ -1,19 +1,16 @@
 """Unit tests for the git_push module."""
 
 import pytest
-from unittest.mock import Mock, patch, call
+from unittest.mock import Mock, patch
 from git import Repo, GitCommandError
 from klingon_tools.git_push import (
     git_push,
+    _get_litellm_tools,
     push_changes,
     _handle_submodule,
     _is_submodule,
     _generate_and_commit_messages,
-)
-from klingon_tools.git_tools import (
-    handle_file_deletions
-    as
-    _handle_file_deletions
+    _handle_file_deletions,
 )
 
 
@@ -41,15 +38,46 @@ def test_git_push(mock_push_changes, mock_is_submodule, mock_generate,
     mock_push_changes.assert_called_once_with(mock_repo)
 
 
-@patch('klingon_tools.git_push.subprocess.run')
-def test_handle_file_deletions(mock_run, mock_repo):
+@patch('klingon_tools.git_push._litellm_tools', None)
+@patch('klingon_tools.git_push.LiteLLMTools')
+def test_get_litellm_tools_reuses_instance(mock_litellm_tools):
+    """Tests that _get_litellm_tools only constructs LiteLLMTools once."""
+    first = _get_litellm_tools()
+    second = _get_litellm_tools()
+
+    assert first is second
+    mock_litellm_tools.assert_called_once_with()
+
+
+def test_handle_file_deletions(mock_repo):
     """Tests the _handle_file_deletions function."""
-    mock_run.return_value.stdout = "file1.txt\nfile2.txt"
+    mock_repo.git.ls_files.return_value = "file1.txt\nfile2.txt"
+    mock_repo.head.commit.hexsha = "parent_sha"
+    mock_repo.git.write_tree.return_value = "tree_sha"
+    mock_repo.git.commit_tree.return_value = "commit_sha"
 
     _handle_file_deletions(mock_repo)
 
-    assert mock_repo.index.remove.call_count == 2
-    assert mock_repo.index.commit.call_count == 2
+    mock_repo.git.ls_files.assert_called_once_with("--deleted")
+    mock_repo.index.remove.assert_called_once_with(
+        ["file1.txt", "file2.txt"], working_tree=True)
+    mock_repo.git.commit_tree.assert_called_once_with(
+        "tree_sha", "-p", "parent_sha",
+        "-m", "chore(cleanup): Cleanup 2 deleted item(s)")
+    mock_repo.git.update_ref.assert_called_once_with(
+        "-m", "commit: chore(cleanup): Cleanup 2 deleted item(s)",
+        "HEAD", "commit_sha", "parent_sha")
+    mock_repo.index.commit.assert_not_called()
+
+
+def test_handle_file_deletions_none(mock_repo):
+    """Tests _handle_file_deletions when nothing has been deleted."""
+    mock_repo.git.ls_files.return_value = ""
+
+    _handle_file_deletions(mock_repo)
+
+    mock_repo.index.remove.assert_not_called()
+    mock_repo.index.commit.assert_not_called()
 
 
 @patch('klingon_tools.git_push.subprocess.run')
@@ -90,23 +118,31 @@ def test_handle_submodule(mock_git_repo, mock_repo):
 @patch('klingon_tools.git_push.log_message')
 def test_push_changes(mock_log, mock_repo):
     """Tests the push_changes function."""
-    mock_repo.is_dirty.return_value = True
     mock_repo.active_branch.name = "main"
 
     push_changes(mock_repo)
 
-    mock_repo.remotes.origin.fetch.assert_called_once()
-    assert mock_repo.git.stash.call_count == 2
-    mock_repo.git.stash.assert_has_calls([
-        call('save', '--include-untracked', 'Auto stash before rebase'),
-        call('pop')
-    ], any_order=True)
-    mock_repo.git.rebase.assert_called_once_with("origin/main")
-    mock_repo.git.stash.assert_called_with("pop")
+    mock_repo.git.pull.assert_called_once_with(
+        "--rebase", "--autostash", "origin", "main")
+    mock_repo.remotes.origin.fetch.assert_not_called()
+    mock_repo.git.stash.assert_not_called()
+    mock_repo.git.rebase.assert_not_called()
     mock_repo.remotes.origin.push.assert_called_once()
     mock_log.info.assert_called_once()
 
 
+@patch('klingon_tools.git_push.log_message')
+def test_push_changes_pull_error(mock_log, mock_repo):
+    """Tests that push_changes aborts when the rebase pull fails."""
+    mock_repo.active_branch.name = "main"
+    mock_repo.git.pull.side_effect = GitCommandError("pull", "conflict")
+
+    push_changes(mock_repo)
+
+    mock_repo.remotes.origin.push.assert_not_called()
+    mock_log.error.assert_called_once()
+
+
 @patch('klingon_tools.git_push.log_message')
 def test_push_changes_error(mock_log, mock_repo):
     """Tests the push_changes function when an error occurs."""
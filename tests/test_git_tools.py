@@ -5,6 +5,7 @@ from klingon_tools.git_tools import (
     cleanup_lock_file,
     git_get_toplevel,
     git_get_status,
+    handle_file_deletions,
 )
 
 
@@ -22,6 +23,31 @@ def test_branch_exists():
         assert not branch_exists('non_existent_branch')
 
 
+def test_handle_file_deletions(mock_repo):
+    mock_repo.git.ls_files.return_value = "file1.txt\nfile2.txt"
+    mock_repo.head.commit.hexsha = "parent_sha"
+    mock_repo.git.write_tree.return_value = "tree_sha"
+
+    handle_file_deletions(mock_repo)
+
+    mock_repo.git.ls_files.assert_called_once_with("--deleted")
+    mock_repo.index.remove.assert_called_once_with(
+        ["file1.txt", "file2.txt"], working_tree=True)
+    mock_repo.git.commit_tree.assert_called_once_with(
+        "tree_sha", "-p", "parent_sha",
+        "-m", "chore(cleanup): Cleanup 2 deleted item(s)")
+    mock_repo.index.commit.assert_not_called()
+
+
+def test_handle_file_deletions_none(mock_repo):
+    mock_repo.git.ls_files.return_value = ""
+
+    handle_file_deletions(mock_repo)
+
+    mock_repo.index.remove.assert_not_called()
+    mock_repo.git.commit_tree.assert_not_called()
+
+
 def test_cleanup_lock_file(tmp_path):
     lock_file = tmp_path / '.git' / 'index.lock'
     lock_file.parent.mkdir(parents=True)
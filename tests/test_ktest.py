@@ -7,10 +7,11 @@ from klingon_tools.ktest import (
     ktest,
     ktest_entrypoint,
     KTestLogPlugin,
-    _setup_output_capture,
+    _capture_output,
     _prepare_pytest_args
 )
 import io
+import sys
 import argparse
 
 
@@ -22,6 +23,14 @@ def mock_pytest_main():
         yield mock
 
 
+@pytest.fixture(autouse=True)
+def mock_xdist_available():
+    """Fixture to report pytest-xdist as installed."""
+    with patch("klingon_tools.ktest._xdist_available") as mock:
+        mock.return_value = True
+        yield mock
+
+
 @pytest.fixture
 def mock_set_default_style():
     """Fixture to mock set_default_style."""
@@ -55,7 +64,11 @@ def test_ktest_default(
             "--import-mode=importlib",
             "-v",
             "-q",
-            "--disable-warnings"
+            "--disable-warnings",
+            "-p",
+            "no:cacheprovider",
+            "-n",
+            "auto",
         ],
         plugins=[ANY]
     )
@@ -78,7 +91,11 @@ def test_ktest_custom_loglevel(
             "--import-mode=importlib",
             "-v",
             "-q",
-            "--disable-warnings"
+            "--disable-warnings",
+            "-p",
+            "no:cacheprovider",
+            "-n",
+            "auto",
         ],
         plugins=[ANY]
     )
@@ -99,7 +116,11 @@ def test_ktest_as_entrypoint(
             "--import-mode=importlib",
             "-v",
             "-q",
-            "--disable-warnings"
+            "--disable-warnings",
+            "-p",
+            "no:cacheprovider",
+            "-n",
+            "auto",
         ],
         plugins=[ANY]
     )
@@ -127,7 +148,11 @@ def test_ktest_suppress_output(
             "--import-mode=importlib",
             "-v",
             "-q",
-            "--disable-warnings"
+            "--disable-warnings",
+            "-p",
+            "no:cacheprovider",
+            "-n",
+            "auto",
         ],
         plugins=[ANY]
     )
@@ -166,6 +191,10 @@ def test_ktest_no_llm(mock_pytest_main):
             "-v",
             "-q",
             "--disable-warnings",
+            "-p",
+            "no:cacheprovider",
+            "-n",
+            "auto",
             "--no-llm"
         ],
         plugins=[ANY]
@@ -185,13 +214,16 @@ def test_logplugin():
     report = MagicMock(when="call", nodeid="test_passed",
                        passed=True, failed=False, skipped=False)
     plugin.pytest_runtest_logreport(report)
-    assert results == [("test_passed", "passed")]
+    assert results == [{"name": "test_passed", "outcome": "passed"}]
 
     # Test failed test
     report = MagicMock(when="call", nodeid="test_failed", passed=False,
                        failed=True, skipped=False, keywords={})
     plugin.pytest_runtest_logreport(report)
-    assert results == [("test_passed", "passed"), ("test_failed", "failed")]
+    assert results == [
+        {"name": "test_passed", "outcome": "passed"},
+        {"name": "test_failed", "outcome": "failed"},
+    ]
 
     # Test optional failed test
     report = MagicMock(
@@ -204,9 +236,9 @@ def test_logplugin():
     )
     plugin.pytest_runtest_logreport(report)
     assert results == [
-        ("test_passed", "passed"),
-        ("test_failed", "failed"),
-        ("test_optional_failed", "optional-failed"),
+        {"name": "test_passed", "outcome": "passed"},
+        {"name": "test_failed", "outcome": "failed"},
+        {"name": "test_optional_failed", "outcome": "optional-failed"},
     ]
 
     # Test skipped test
@@ -214,24 +246,42 @@ def test_logplugin():
                        failed=False, skipped=True)
     plugin.pytest_runtest_logreport(report)
     assert results == [
-        ("test_passed", "passed"),
-        ("test_failed", "failed"),
-        ("test_optional_failed", "optional-failed"),
-        ("test_skipped", "skipped")
+        {"name": "test_passed", "outcome": "passed"},
+        {"name": "test_failed", "outcome": "failed"},
+        {"name": "test_optional_failed", "outcome": "optional-failed"},
+        {"name": "test_skipped", "outcome": "skipped"}
     ]
 
 
 @pytest.mark.timeout(5)
-def test_setup_output_capture():
-    """Test the _setup_output_capture function."""
-    captured_output = _setup_output_capture(True, "INFO")
-    assert isinstance(captured_output, io.StringIO)
+def test_capture_output():
+    """Test the _capture_output context manager."""
+    original_stdout = sys.stdout
+    with _capture_output(True, "INFO") as captured_output:
+        assert isinstance(captured_output, io.StringIO)
+        print("hidden")
+    assert sys.stdout is original_stdout
+    assert captured_output.getvalue() == "hidden\n"
 
-    captured_output = _setup_output_capture(False, "INFO")
-    assert captured_output is None
+    with _capture_output(False, "INFO") as captured_output:
+        assert captured_output is None
+        assert sys.stdout is original_stdout
 
-    captured_output = _setup_output_capture(True, "DEBUG")
-    assert captured_output is None
+    with _capture_output(True, "DEBUG") as captured_output:
+        assert captured_output is None
+        assert sys.stdout is original_stdout
+
+
+@pytest.mark.timeout(5)
+def test_capture_output_restores_on_error():
+    """Test that _capture_output restores the streams if the block raises."""
+    original_stdout = sys.stdout
+    original_stderr = sys.stderr
+    with pytest.raises(RuntimeError):
+        with _capture_output(True, "INFO"):
+            raise RuntimeError("pytest crashed")
+    assert sys.stdout is original_stdout
+    assert sys.stderr is original_stderr
 
 
 @pytest.mark.timeout(5)
@@ -242,3 +292,16 @@ def test_prepare_pytest_args():
 
     args = _prepare_pytest_args(True)
     assert "--no-llm" in args
+
+
+@pytest.mark.timeout(5)
+def test_prepare_pytest_args_without_xdist(mock_xdist_available):
+    """Test that _prepare_pytest_args only parallelises with pytest-xdist."""
+    args = _prepare_pytest_args(False)
+    assert args[-2:] == ["-n", "auto"]
+    assert "no:cacheprovider" in args
+
+    mock_xdist_available.return_value = False
+    args = _prepare_pytest_args(False)
+    assert "-n" not in args
+    assert "no:cacheprovider" in args
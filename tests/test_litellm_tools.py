@@ -1,6 +1,17 @@
+import asyncio
 import pytest
-from unittest.mock import patch, MagicMock
-from klingon_tools.litellm_tools import LiteLLMTools
+from unittest.mock import patch, AsyncMock, MagicMock
+from litellm.exceptions import (
+    AuthenticationError,
+    BadRequestError,
+    RateLimitError,
+)
+from klingon_tools.litellm_tools import (
+    GENERATION_RETRIES,
+    LiteLLMTools,
+    RateLimiter,
+    throttled_complete,
+)
 
 
 @pytest.fixture
@@ -38,6 +49,151 @@ def test_generate_content(mock_completion, litellm_tools, no_llm):
     mock_completion.assert_called_once()
 
 
+@patch('litellm.acompletion', new_callable=AsyncMock)
+def test_agenerate_content(mock_acompletion, litellm_tools, no_llm):
+    if no_llm:
+        pytest.skip("Skipping LLM tests due to --no-llm flag")
+    mock_acompletion.return_value = MagicMock(
+        choices=[
+            MagicMock(
+                message=MagicMock(content="Generated content")
+            )
+        ]
+    )
+    content, model = asyncio.run(
+        litellm_tools.agenerate_content("pull_request_title", "diff"))
+    assert content == "Generated content"
+    assert model == "gpt-4o-mini"
+    mock_acompletion.assert_awaited_once()
+
+
+@patch('klingon_tools.litellm_tools.time.sleep')
+@patch('litellm.completion')
+def test_generate_content_retries(mock_completion, mock_sleep, litellm_tools):
+    mock_completion.side_effect = [
+        BadRequestError("Bad request", "gpt-4o-mini", "openai"),
+        MagicMock(
+            choices=[MagicMock(message=MagicMock(content="Generated"))]
+        ),
+    ]
+    content, _ = litellm_tools.generate_content("pull_request_title", "diff")
+    assert content == "Generated"
+    mock_sleep.assert_called_once_with(2)
+
+
+@patch('klingon_tools.litellm_tools.asyncio.sleep', new_callable=AsyncMock)
+@patch('litellm.acompletion', new_callable=AsyncMock)
+def test_agenerate_content_gives_up(
+    mock_acompletion, mock_sleep, litellm_tools
+):
+    mock_acompletion.side_effect = RateLimitError(
+        "Rate limited", "openai", "gpt-4o-mini")
+    with pytest.raises(ValueError, match="after max retries"):
+        asyncio.run(
+            litellm_tools.agenerate_content("pull_request_title", "diff"))
+    assert mock_acompletion.await_count == GENERATION_RETRIES
+    assert mock_sleep.await_count == GENERATION_RETRIES - 1
+
+
+def test_retry_delay_critical_error(litellm_tools):
+    error = AuthenticationError("Bad key", "openai", "gpt-4o-mini")
+    with pytest.raises(AuthenticationError):
+        litellm_tools._retry_delay(error, 1)
+
+
+def test_rate_limiter_from_env(monkeypatch):
+    monkeypatch.setenv("KLINGON_TOOLS_MAX_RPM", "120")
+    monkeypatch.setenv("KLINGON_TOOLS_MAX_TPM", "1000")
+    rate_limiter = RateLimiter.from_env()
+    assert rate_limiter.max_requests_per_minute == 120
+    assert rate_limiter.max_tokens_per_minute == 1000
+
+
+def test_rate_limiter_waits_for_window():
+    async def acquire_all():
+        rate_limiter = RateLimiter(
+            max_requests_per_minute=2, max_tokens_per_minute=1000, window=0.2
+        )
+        start = asyncio.get_running_loop().time()
+        for _ in range(3):
+            await rate_limiter.acquire(10)
+            rate_limiter.release()
+        return asyncio.get_running_loop().time() - start
+
+    # The third request must wait for the first to leave the window
+    assert asyncio.run(acquire_all()) >= 0.15
+
+
+def test_rate_limiter_token_limit():
+    async def acquire_all():
+        rate_limiter = RateLimiter(
+            max_requests_per_minute=100, max_tokens_per_minute=100,
+            window=0.2
+        )
+        start = asyncio.get_running_loop().time()
+        await rate_limiter.acquire(500)  # Oversized requests still proceed
+        rate_limiter.release()
+        await rate_limiter.acquire(10)
+        rate_limiter.release()
+        return asyncio.get_running_loop().time() - start
+
+    assert asyncio.run(acquire_all()) >= 0.15
+
+
+@patch('litellm.acompletion', new_callable=AsyncMock)
+def test_throttled_complete(mock_acompletion):
+    mock_acompletion.return_value = "response"
+    messages = [{"role": "user", "content": "diff"}]
+
+    async def complete():
+        rate_limiter = RateLimiter()
+        response = await throttled_complete(
+            rate_limiter, model="gpt-4o-mini", messages=messages)
+        return rate_limiter, response
+
+    rate_limiter, response = asyncio.run(complete())
+    assert response == "response"
+    mock_acompletion.assert_awaited_once_with(
+        model="gpt-4o-mini", messages=messages)
+    assert len(rate_limiter._history) == 1
+    assert not rate_limiter._semaphore.locked()
+
+
+@patch('litellm.completion')
+def test_generate_pr_bundle(mock_completion, litellm_tools):
+    mock_completion.return_value = MagicMock(
+        choices=[
+            MagicMock(
+                message=MagicMock(
+                    content='```json\n{"title": "Add feature", '
+                    '"summary": "Summary", "context": "Context"}\n```'
+                )
+            )
+        ]
+    )
+    bundle = litellm_tools.generate_pr_bundle("diff")
+    assert bundle == {
+        "title": "Add feature".ljust(72),
+        "summary": "Summary",
+        "context": "Context",
+    }
+    mock_completion.assert_called_once()
+    assert mock_completion.call_args.kwargs["response_format"] == {
+        "type": "json_object"
+    }
+
+
+@patch('litellm.completion')
+def test_generate_pr_bundle_missing_key(mock_completion, litellm_tools):
+    mock_completion.return_value = MagicMock(
+        choices=[
+            MagicMock(message=MagicMock(content='{"title": "Add feature"}'))
+        ]
+    )
+    with pytest.raises(ValueError):
+        litellm_tools.generate_pr_bundle("diff")
+
+
 def test_format_message(litellm_tools):
     message = "feat(scope): Add new feature"
     formatted = litellm_tools.format_message(message)
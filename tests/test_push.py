@@ -95,7 +95,7 @@ def test_workflow_process_file():
     with patch('klingon_tools.push.git_pre_commit') as mock_pre_commit, \
             patch('klingon_tools.push.git_commit_file') as mock_commit, \
             patch('klingon_tools.push.validate_commit_message',
-                  return_value=True), \
+                  return_value=(True, None)), \
             patch('klingon_tools.push.committed_not_pushed', new=[]):
         mock_pre_commit.return_value = (True, None)
         mock_args.dryrun = False
@@ -109,6 +109,107 @@ def test_workflow_process_file():
         )
 
 
+def test_workflow_process_file_auto_fixed():
+    """Test that workflow_process_file commits an auto-fixed message."""
+    mock_repo = MagicMock()
+    mock_args = MagicMock()
+    mock_litellm = MagicMock()
+    mock_litellm.generate_commit_message_for_file.return_value = (
+        "feat(core): " + "long description " * 6
+    )
+    with patch('klingon_tools.push.git_pre_commit') as mock_pre_commit, \
+            patch('klingon_tools.push.git_commit_file') as mock_commit, \
+            patch('klingon_tools.push.validate_commit_message',
+                  side_effect=[
+                      (False, "feat(core): fixed message"), (True, None)
+                  ]) as mock_validate, \
+            patch('klingon_tools.push.committed_not_pushed', new=[]):
+        mock_pre_commit.return_value = (True, None)
+        mock_args.dryrun = False
+        workflow_process_file(
+            'file1.py', ['file1.py'], mock_repo, mock_args,
+            MagicMock(), mock_litellm, 1
+        )
+        # The fixed message is validated before it is used
+        assert mock_validate.call_args.args[0] == "feat(core): fixed message"
+        mock_commit.assert_called_once_with(
+            'file1.py', mock_repo, "feat(core): fixed message"
+        )
+
+
+def test_workflow_process_file_invalid_fix():
+    """Test that workflow_process_file never commits an invalid fix."""
+    mock_repo = MagicMock()
+    mock_args = MagicMock()
+    mock_litellm = MagicMock()
+    mock_litellm.generate_commit_message_for_file.return_value = (
+        "feat(core): " + "long description " * 6
+    )
+
+    def validate(message, log_message):
+        if message == "feat(core):\nfixed message":
+            return False, None
+        return False, "feat(core):\nfixed message"
+
+    with patch('klingon_tools.push.git_pre_commit') as mock_pre_commit, \
+            patch('klingon_tools.push.git_commit_file') as mock_commit, \
+            patch('klingon_tools.push.validate_commit_message',
+                  side_effect=validate), \
+            patch('klingon_tools.push.committed_not_pushed', new=[]):
+        mock_args.dryrun = False
+        workflow_process_file(
+            'file1.py', ['file1.py'], mock_repo, mock_args,
+            MagicMock(), mock_litellm, 1, max_retries=2
+        )
+        mock_pre_commit.assert_not_called()
+        mock_commit.assert_not_called()
+        # Each rejected message is regenerated and the file left unstaged
+        assert mock_litellm.generate_commit_message_for_file.call_count == 2
+        mock_repo.git.reset.assert_called_with("-q", "--", 'file1.py')
+
+
+def test_workflow_process_file_invalid_message():
+    """Test that workflow_process_file skips commits with invalid messages."""
+    mock_repo = MagicMock()
+    mock_args = MagicMock()
+    mock_litellm = MagicMock()
+    mock_litellm.generate_commit_message_for_file.return_value = "bad message"
+    with patch('klingon_tools.push.git_pre_commit') as mock_pre_commit, \
+            patch('klingon_tools.push.git_commit_file') as mock_commit, \
+            patch('klingon_tools.push.validate_commit_message',
+                  return_value=(False, None)), \
+            patch('klingon_tools.push.committed_not_pushed', new=[]):
+        mock_args.dryrun = False
+        workflow_process_file(
+            'file1.py', ['file1.py'], mock_repo, mock_args,
+            MagicMock(), mock_litellm, 1
+        )
+        mock_pre_commit.assert_not_called()
+        mock_commit.assert_not_called()
+        mock_repo.git.reset.assert_called_with("-q", "--", 'file1.py')
+
+
+def test_workflow_process_file_unstages_without_commits(tmp_path):
+    """Test that a rejected file is unstaged in a repo with no commits."""
+    from git import Repo
+
+    repo = Repo.init(tmp_path)
+    (tmp_path / 'file1.py').write_text("print('hello')\n")
+    mock_args = MagicMock()
+    mock_litellm = MagicMock()
+    mock_litellm.generate_commit_message_for_file.return_value = "bad message"
+    with patch('klingon_tools.push.git_commit_file') as mock_commit, \
+            patch('klingon_tools.push.validate_commit_message',
+                  return_value=(False, None)), \
+            patch('klingon_tools.push.committed_not_pushed', new=[]):
+        workflow_process_file(
+            'file1.py', ['file1.py'], repo, mock_args,
+            MagicMock(), mock_litellm, 1, max_retries=1
+        )
+        mock_commit.assert_not_called()
+    assert repo.git.diff("--cached", "--name-only") == ""
+
+
 def test_expand_file_patterns():
     with patch('glob.glob') as mock_glob:
         mock_glob.side_effect = [